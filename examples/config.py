@@ -8,4 +8,10 @@ CONFIG: dict = {
     "diversity_weight": 2,
     "diversity_threshold": 0.5,
     "initial_preference_adherent_percentage": 0.3,
+    "deduplicate": True,
+    "duplicate_mutation_rate": 0.5,
+    "reoptimize_generations": 100,
+    "surrogate_fraction": None,
+    "surrogate_max_error": 0.5,
+    "debug_validation": False,
 }
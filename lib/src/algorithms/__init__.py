@@ -1 +1,28 @@
-from . import *
+import importlib
+
+# Public names and the module defining them. Modules are only imported on first access,
+# so that importing the package stays cheap.
+_EXPORTS = {
+    "Crossover": "crossover",
+    "Deduplication": "deduplication",
+    "FitnessEvaluator": "fitness",
+    "TimetableGenerator": "generative_algorithm",
+    "MultiCohortTimetableGenerator": "multi_cohort",
+    "Mutation": "mutatation",
+    "ParetoTimetableGenerator": "nsga2",
+    "PopulationInitializer": "population",
+    "Selection": "selection",
+    "SolutionCache": "solution_cache",
+    "SuccessiveHalvingSweep": "sweep",
+    "solve_many": "batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
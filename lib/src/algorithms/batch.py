@@ -0,0 +1,93 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional
+
+from lib.src.algorithms.generative_algorithm import TimetableGenerator
+
+# Configuration used for the keys that neither the caller nor the problem sets,
+# the same values as CONFIG in the repository's config.py
+DEFAULT_CONFIG: Dict = {
+    "population_size": 100,
+    "num_generations": 1000,
+    "elite_percentage": 0.2,
+    "initial_mutation_rate": 0.3,
+    "final_mutation_rate": 0.01,
+    "tournament_size": 3,
+    "diversity_weight": 2,
+    "diversity_threshold": 0.5,
+    "initial_preference_adherent_percentage": 0.3,
+}
+
+
+def solve_problem(
+    index: int, problem: Dict, config: Dict, max_generations: Optional[int] = None
+) -> Dict:
+    """Solve a single problem. This is the unit of work run by solve_many.
+    Args: index (int): The position of the problem in the batch.
+          problem (Dict): The problem, with keys subjects, days, time_slots, preferences
+                          and optionally id and config (merged over config).
+          config (Dict): The configuration, merged over DEFAULT_CONFIG and overridden by
+                         problem["config"].
+          max_generations (int): Passed to TimetableGenerator.evolve.
+    """
+    started = time.perf_counter()
+    result = {"index": index, "id": problem.get("id", index)}
+    try:
+        ga = TimetableGenerator(
+            config={**DEFAULT_CONFIG, **config, **problem.get("config", {})},
+            subjects=problem["subjects"],
+            days=problem["days"],
+            time_slots=problem["time_slots"],
+            preferences=problem["preferences"],
+        )
+        best = ga.evolve(max_generations=max_generations)
+        result["timetable"] = best.timetable
+        result["fitness"] = ga.fitness_evaluator.calculate_fitness(best)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def solve_many(
+    problems: Iterable[Dict],
+    workers: Optional[int] = None,
+    config: Optional[Dict] = None,
+    max_generations: Optional[int] = None,
+) -> Iterator[Dict]:
+    """Solve independent problems across a process pool, yielding each result as soon as it finishes.
+    Results arrive in completion order; use their "index" (or "id") to match them to problems.
+    Each result holds the best "timetable" and its "fitness", or an "error" message, plus the
+    wall-clock "elapsed" seconds.
+    problems is consumed lazily, with at most two problems per worker in flight, so it can be a
+    stream of any length.
+    Args: problems (Iterable[Dict]): The problems, see solve_problem.
+          workers (int): The number of worker processes. Defaults to the number of CPUs.
+                         With 1, problems are solved in the calling process.
+          config (Dict): The configuration, merged over DEFAULT_CONFIG and overridden per
+                         problem by problem["config"].
+          max_generations (int): Passed to TimetableGenerator.evolve.
+    """
+    config = config or {}
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for index, problem in enumerate(problems):
+            yield solve_problem(index, problem, config, max_generations)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        max_pending = workers * 2
+        pending = set()
+        for index, problem in enumerate(problems):
+            pending.add(
+                executor.submit(solve_problem, index, problem, config, max_generations)
+            )
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -1,5 +1,5 @@
 import random
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from lib.src.models.individual import Individual
 
 
@@ -18,4 +18,41 @@ class Crossover:
             **dict(list(parent2.timetable.items())[:crossover_point]),
             **dict(list(parent1.timetable.items())[crossover_point:]),
         }
-        return Individual(child1_timetable), Individual(child2_timetable)
+        # Copy the day schedules so that mutating a child never alters its parents
+        child1 = Individual(Crossover._copy_days(child1_timetable))
+        child2 = Individual(Crossover._copy_days(child2_timetable))
+        child1.validated = child2.validated = parent1.validated and parent2.validated
+        return child1, child2
+
+    @staticmethod
+    def _copy_days(timetable: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+        return {day: dict(slots) for day, slots in timetable.items()}
+
+    @staticmethod
+    def single_point_crossover_into(
+        parent1: Individual,
+        parent2: Individual,
+        days: List[str],
+        child1: Individual,
+        child2: Optional[Individual] = None,
+    ):
+        """Same as single_point_crossover, but writes the children into existing individuals
+        instead of allocating new ones. child2 may be omitted when only one child is needed.
+        """
+        assert len(parent1.timetable) == len(parent2.timetable), "Invalid parents"
+        crossover_point = random.randint(1, len(days) - 1)
+        for i, day in enumerate(days):
+            first, second = (
+                (parent1, parent2) if i < crossover_point else (parent2, parent1)
+            )
+            child1.timetable[day].update(first.timetable[day])
+            child1.occupancy[day] = first.occupancy[day]
+            if child2 is not None:
+                child2.timetable[day].update(second.timetable[day])
+                child2.occupancy[day] = second.occupancy[day]
+        validated = parent1.validated and parent2.validated
+        child1.invalidate_scores()
+        child1.validated = validated
+        if child2 is not None:
+            child2.invalidate_scores()
+            child2.validated = validated
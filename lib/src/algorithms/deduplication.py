@@ -0,0 +1,52 @@
+from typing import List
+
+from lib.src.algorithms.mutatation import Mutation
+from lib.src.algorithms.population import PopulationInitializer
+from lib.src.models.individual import Individual
+
+
+class Deduplication:
+    @staticmethod
+    def replace_duplicates(
+        population: List[Individual],
+        population_initializer: PopulationInitializer,
+        subjects: List[str],
+        mutation_rate: float,
+        max_attempts: int = 3,
+    ) -> float:
+        """Replace every individual whose timetable already appeared earlier in the population.
+        The first occurrence is kept, so elites placed at the front of the population survive.
+        A duplicate is heavily mutated in place, or overwritten with a fresh random individual
+        if mutation keeps producing known genomes.
+        Args: population (List[Individual]): The population. Individuals are modified in place and
+                  must not share timetables with each other.
+              population_initializer (PopulationInitializer): Used to generate fresh individuals.
+              subjects (List[str]): The list of subjects.
+              mutation_rate (float): The mutation rate applied to duplicates.
+              max_attempts (int): The number of mutation attempts before falling back to a fresh individual.
+        Returns: float: The clone rate, i.e. the fraction of the population that was a duplicate.
+        """
+        if not population:
+            return 0.0
+
+        seen = set()
+        clones = 0
+        for individual in population:
+            key = individual.genome_key()
+            if key not in seen:
+                seen.add(key)
+                continue
+
+            clones += 1
+            for _ in range(max_attempts):
+                Mutation.random_mutation(individual, subjects, mutation_rate)
+                key = individual.genome_key()
+                if key not in seen:
+                    break
+            else:
+                individual.copy_from(population_initializer.generate_individual())
+                key = individual.genome_key()
+
+            seen.add(key)
+
+        return clones / len(population)
@@ -1,8 +1,8 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
 
 from lib.src.models.individual import Individual
-from lib.src.models.penalties.penalty import Penalties
-from lib.src.models.rewards.reward import Rewards
+from lib.src.models.penalties.penalty import BasePenalty, Penalties
+from lib.src.models.rewards.reward import BaseReward, Rewards
 from lib.src.utils.validators import TimetableValidator
 from lib.src.models.rewards.rewards import reward_objects
 from lib.src.models.penalties.penalties import penalty_objects
@@ -13,12 +13,21 @@ class FitnessEvaluator:
     Args: subjects (List[str]): The list of subjects.
           time_slots (List[str]): The list of time slots.
           preferences (Dict): The preferences of the students.
+          debug_validation (bool): Whether to run the full validity check on every evaluation,
+                                   even for individuals already marked as validated.
     """
 
-    def __init__(self, subjects: List[str], time_slots: List[str], preferences: Dict):
+    def __init__(
+        self,
+        subjects: List[str],
+        time_slots: List[str],
+        preferences: Dict,
+        debug_validation: bool = False,
+    ):
         self.subjects = subjects
         self.time_slots = time_slots
         self.preferences = preferences
+        self.debug_validation = debug_validation
         self.penalties = Penalties()
         self.rewards = Rewards()
 
@@ -27,13 +36,86 @@ class FitnessEvaluator:
         for reward in reward_objects:
             self.rewards.register_reward(reward)
 
+        # Name -> term map, rebuilt only when a penalty or reward is registered
+        self._terms: Dict[str, Union[BasePenalty, BaseReward]] = {}
+        self._penalty_names: List[str] = []
+        self._reward_names: List[str] = []
+        self._registered = (-1, -1)
+
+    @property
+    def terms(self) -> Dict[str, Union[BasePenalty, BaseReward]]:
+        """The registered penalties, then rewards, by name. The name is the class name, suffixed
+        with #2, #3, ... when an earlier term already took it, so every registered term has its own
+        score even if a class is registered twice. The returned dict must not be modified.
+        """
+        registered = (len(self.penalties.penalty_objects), len(self.rewards.rewards))
+        if registered != self._registered:
+            terms = {}
+            for term in self.penalties.penalty_objects + self.rewards.rewards:
+                name = type(term).__name__
+                count = 1
+                while name in terms:
+                    count += 1
+                    name = f"{type(term).__name__}#{count}"
+                terms[name] = term
+            names = list(terms)
+            self._terms = terms
+            self._penalty_names = names[: registered[0]]
+            self._reward_names = names[registered[0] :]
+            self._registered = registered
+        return self._terms
+
+    def is_valid(self, individual: Individual) -> bool:
+        """Individuals built by the engine's operators, or checked at an input boundary, are valid
+        by construction and are trusted. Others are checked once and marked as validated.
+        """
+        if individual.validated and not self.debug_validation:
+            return True
+        individual.validated = TimetableValidator.is_valid(
+            individual, self.subjects, self.time_slots
+        )
+        return individual.validated
+
+    def calculate_term_scores(
+        self, individual: Individual
+    ) -> Optional[Dict[str, float]]:
+        """Return the weighted score of every penalty and reward by name (see terms), or None if the
+        individual is invalid. Scores are cached on the individual until one of its slots changes,
+        and only the missing ones are computed."""
+        if not self.is_valid(individual):
+            return None
+        scores = individual.term_scores if individual.scored_by is self else {}
+        terms = self.terms
+        if len(scores) == len(terms):
+            return scores
+        for name, term in terms.items():
+            if name not in scores:
+                scores[name] = (
+                    term.calculate(
+                        individual, self.preferences, self.subjects, self.time_slots
+                    )
+                    * term.weight
+                )
+        individual.term_scores = scores
+        individual.scored_by = self
+        return scores
+
     def calculate_fitness(self, individual: Individual) -> float:
-        if not TimetableValidator.is_valid(individual, self.subjects, self.time_slots):
+        """Return 1000 - penalties + rewards, or -inf if the individual is invalid. An individual
+        given a predicted_fitness by a surrogate model and not scored since gets the prediction.
+        """
+        if (
+            individual.predicted_fitness is not None
+            and individual.scored_by is not self
+        ):
+            return individual.predicted_fitness
+        scores = self.calculate_term_scores(individual)
+        if scores is None:
             return float("-inf")
-        penalty = self.penalties.calculate_total_penalty(
-            individual, self.preferences, self.subjects, self.time_slots
-        )
-        reward = self.rewards.calculate_total_reward(
-            individual, self.preferences, self.subjects, self.time_slots
-        )
+        penalty = 0.0
+        for name in self._penalty_names:
+            penalty += scores[name]
+        reward = 0.0
+        for name in self._reward_names:
+            reward += scores[name]
         return 1000 - penalty + reward
@@ -1,17 +1,22 @@
 import json
+import math
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from lib.src.algorithms.crossover import Crossover
+from lib.src.algorithms.deduplication import Deduplication
 from lib.src.algorithms.fitness import FitnessEvaluator
 from lib.src.algorithms.mutatation import Mutation
 from lib.src.algorithms.population import PopulationInitializer
 from lib.src.algorithms.selection import Selection
+from lib.src.algorithms.surrogate import SurrogateModel
 
+from lib.src.models.encoding import GenomeEncoder
 from lib.src.models.individual import Individual
+from lib.src.models.population_store import MemmapPopulationStore
 from lib.src.models.penalties.penalty import Penalties
 from lib.src.models.rewards.reward import Rewards
-from lib.src.utils.helpers import create_directory_if_not_exists
+from lib.src.utils.helpers import create_directory_if_not_exists, import_numpy
 from lib.src.utils.validators import TimetableValidator
 
 
@@ -37,27 +42,62 @@ class TimetableGenerator:
         self.population_initializer = PopulationInitializer(
             subjects, days, time_slots, preferences
         )
-        self.fitness_evaluator = FitnessEvaluator(subjects, time_slots, preferences)
+        self.fitness_evaluator = FitnessEvaluator(
+            subjects,
+            time_slots,
+            preferences,
+            self.config.get("debug_validation", False),
+        )
 
         self.current_generation = 0
         self.population = []
+        self.clone_rate = 0.0
+        # Preallocated buffer the next generation is written into, swapped with population
+        self._next_population: List[Individual] = []
 
-    def checkpoint(self, file_name: str):
-        """Save the state of the timetable generator to a file."""
-        CHECKPOINT_DIR = "checkpoints"
-        create_directory_if_not_exists(CHECKPOINT_DIR)
-        state = {
+        # Optional surrogate whose estimates stand in for the exact fitness of weak offspring
+        self.surrogate = self._build_surrogate()
+
+    def _build_surrogate(self) -> Optional[SurrogateModel]:
+        """Build the surrogate model if config["surrogate_fraction"] is set.
+        Raises: ValueError: If the fraction is not in (0, 1].
+        """
+        fraction = self.config.get("surrogate_fraction")
+        if not fraction:
+            return None
+        if not 0 < fraction <= 1:
+            raise ValueError(f"surrogate_fraction must be in (0, 1], got {fraction}")
+        return SurrogateModel(
+            self.subjects,
+            self.days,
+            alpha=self.config.get("surrogate_ridge_alpha", 1.0),
+            max_error=self.config.get("surrogate_max_error", 0.5),
+        )
+
+    def get_state(self) -> Dict:
+        """Return the JSON serializable state of the timetable generator, as saved by checkpoint.
+        The weighted penalty/reward scores of each individual are included so that reoptimize
+        only has to recompute the terms affected by a change."""
+        return {
             "current_generation": self.current_generation,
             "config": self.config,
             "subjects": self.subjects,
             "days": self.days,
             "time_slots": self.time_slots,
             "preferences": self.preferences,
-            "best_individual": max(
-                self.population, key=self.fitness_evaluator.calculate_fitness
-            ).timetable,
+            "best_individual": self._best_individual().timetable,
             "population": [ind.timetable for ind in self.population],
+            "term_scores": [
+                self.fitness_evaluator.calculate_term_scores(ind)
+                for ind in self.population
+            ],
         }
+
+    def checkpoint(self, file_name: str):
+        """Save the state of the timetable generator to a file."""
+        CHECKPOINT_DIR = "checkpoints"
+        create_directory_if_not_exists(CHECKPOINT_DIR)
+        state = self.get_state()
         file_name = f"{CHECKPOINT_DIR}/{file_name}"
         with open(file_name, "w") as f:
             json.dump(state, f, indent=4)
@@ -71,20 +111,112 @@ class TimetableGenerator:
         self.days = state["days"]
         self.time_slots = state["time_slots"]
         self.preferences = state["preferences"]
-        self.population = state["population"]
         self.current_generation = state["current_generation"]
         self.population_initializer = PopulationInitializer(
             self.subjects, self.days, self.time_slots, self.preferences
         )
         self.fitness_evaluator = FitnessEvaluator(
-            self.subjects, self.time_slots, self.preferences
+            self.subjects,
+            self.time_slots,
+            self.preferences,
+            self.config.get("debug_validation", False),
+        )
+        self.surrogate = self._build_surrogate()
+        self.population = [
+            self.validate_input(Individual(timetable), file_name)
+            for timetable in state["population"]
+        ]
+
+    def reoptimize(
+        self, previous_state: Dict, new_preferences: Dict, verbose=False
+    ) -> Individual:
+        """Re-solve after the preferences of a previous run changed, starting from its final population.
+        Only the penalties and rewards that depend on preferences are recomputed for the kept
+        population, and the search continues for config["reoptimize_generations"] generations
+        (defaults to a tenth of num_generations) from the previous generation, so the mutation
+        rate stays close to its final value.
+        Args: previous_state (Dict): The state of the previous run, from get_state or a checkpoint file.
+              new_preferences (Dict): The edited preferences.
+        """
+        for key in ("subjects", "days", "time_slots"):
+            if previous_state[key] != getattr(self, key):
+                raise ValueError(
+                    f"reoptimize only supports preference edits, but {key} changed"
+                )
+
+        self.preferences = new_preferences
+        self.population_initializer = PopulationInitializer(
+            self.subjects, self.days, self.time_slots, new_preferences
+        )
+        self.fitness_evaluator = FitnessEvaluator(
+            self.subjects,
+            self.time_slots,
+            new_preferences,
+            self.config.get("debug_validation", False),
         )
+        # The surrogate was trained on fitness values under the old preferences
+        self.surrogate = self._build_surrogate()
+
+        changed = self._changed_preference_subjects(
+            previous_state["preferences"], new_preferences
+        )
+        affected = {
+            name
+            for name, term in self.fitness_evaluator.terms.items()
+            if term.depends_on_preferences
+        }
+        population = []
+        term_scores = previous_state.get("term_scores") or []
+        for i, timetable in enumerate(previous_state["population"]):
+            individual = self.validate_input(Individual(timetable), "previous state")
+            if i < len(term_scores) and term_scores[i] is not None:
+                individual.term_scores = {
+                    name: score
+                    for name, score in term_scores[i].items()
+                    if not (changed and name in affected)
+                }
+                individual.scored_by = self.fitness_evaluator
+            population.append(individual)
+        population.sort(key=self.fitness_evaluator.calculate_fitness, reverse=True)
+
+        if not changed:
+            self.population = population
+            return population[0].copy()
+
+        start_generation = previous_state.get("current_generation", 0)
+        return self.evolve(
+            start_generation=start_generation,
+            max_generations=start_generation
+            + self.config.get(
+                "reoptimize_generations",
+                max(1, self.config["num_generations"] // 10),
+            ),
+            verbose=verbose,
+            initial_population=population,
+        )
+
+    @staticmethod
+    def _changed_preference_subjects(old: Dict, new: Dict) -> List[str]:
+        """Return the subjects whose preferred slots differ, treating None as no preference."""
+
+        def preferred(preferences: Dict, subject: str) -> Dict:
+            return {
+                day: time
+                for day, time in preferences.get(subject, {}).items()
+                if time is not None
+            }
+
+        return [
+            subject
+            for subject in set(old) | set(new)
+            if preferred(old, subject) != preferred(new, subject)
+        ]
 
     def initialize_from_partial_state(self, partial_state: Dict[str, Dict[str, str]]):
         """Initialize the population from a partial state."""
         self.population = []
         for _ in range(self.config["population_size"]):
-            individual = self.complete_partial_state(partial_state)
+            individual = self.complete_partial_solution(partial_state)
             self.population.append(individual)
 
     def complete_partial_solution(
@@ -109,7 +241,36 @@ class TimetableGenerator:
                         subject = "Free"
                     complete_solution[day][time] = subject
 
-        return Individual(complete_solution)
+        return self.validate_input(Individual(complete_solution), "partial solution")
+
+    def validate_input(self, individual: Individual, source: str) -> Individual:
+        """Check an individual that does not come from the engine's own operators (a checkpoint,
+        a seed or a partial solution) and mark it as validated, so the fitness evaluator trusts it.
+        If its days or time slots are not in the problem's order, a reordered individual is returned
+        instead, so that every individual shares the same slot bits and day order. Any surrogate
+        estimate it carries is dropped, so that it is scored exactly.
+        Args: individual (Individual): The individual to check.
+              source (str): Where the individual comes from, for the error message.
+        Raises: ValueError: If the timetable does not cover exactly the days and time slots of the
+                            problem, or holds a subject that is not part of it.
+        """
+        timetable = individual.timetable
+        if set(timetable) != set(self.days) or not TimetableValidator.is_valid(
+            individual, self.subjects, self.time_slots
+        ):
+            raise ValueError(f"Invalid timetable in {source}")
+        if list(timetable) != list(self.days) or any(
+            list(schedule) != list(self.time_slots) for schedule in timetable.values()
+        ):
+            individual = Individual(
+                {
+                    day: {time: timetable[day][time] for time in self.time_slots}
+                    for day in self.days
+                }
+            )
+        individual.validated = True
+        individual.predicted_fitness = None
+        return individual
 
     def elitism_with_diversity(
         self, population: List[Individual], elite_size: int
@@ -144,16 +305,39 @@ class TimetableGenerator:
         start_generation: int = 0,
         max_generations=None,
         verbose=False,
+        progress_callback: Optional[Callable[[int, Individual, float], bool]] = None,
+        progress_interval: int = 10,
+        initial_population: Optional[List[Individual]] = None,
+        stop_generation: Optional[int] = None,
     ):
-        """Evolve the timetable for the given number of generations or continue from the current state."""
+        """Evolve the timetable for the given number of generations or continue from the current state.
+        max_generations (defaults to config["num_generations"]) is also the horizon of the mutation
+        rate schedule; stop_generation, if given, stops evolution earlier without changing it.
+        If given, progress_callback(generation, best_individual, best_fitness) is called every
+        progress_interval generations; evolution stops early when it returns False.
+        If given, initial_population (e.g. the population of an earlier run) is used as the first
+        generation, topped up with random individuals or truncated to the population size.
+        """
         population_size = self.config["population_size"]
         num_generations = max_generations or self.config["num_generations"]
         elite_size = int(self.config["elite_percentage"] * population_size)
 
-        if initial_solution:
+        if initial_population:
+            # The validated flag is not tied to a problem, so seeds are always checked
+            self.population = [
+                self.validate_input(individual.copy(), "initial population")
+                for individual in initial_population[:population_size]
+            ]
+            while len(self.population) < population_size:
+                self.population.append(
+                    self.population_initializer.generate_individual()
+                )
+        elif initial_solution:
             self.population = (
                 self.population_initializer.initialize_population_with_seed(
-                    population_size, initial_solution
+                    population_size,
+                    self.validate_input(initial_solution.copy(), "initial solution"),
+                    self.config["initial_mutation_rate"],
                 )
             )
         else:
@@ -163,62 +347,296 @@ class TimetableGenerator:
             )
 
         self.current_generation = start_generation
+        self._allocate_next_population()
 
-        for generation in range(self.current_generation, num_generations):
+        end_generation = min(num_generations, stop_generation or num_generations)
+        for generation in range(self.current_generation, end_generation):
             self.current_generation = generation
-            new_population = []
+            new_population = self._next_population
 
-            # Add the elite individuals to the new population
+            # Copy the elite individuals into the next generation
             elite = self.elitism_with_diversity(self.population, elite_size)
-            new_population.extend(elite)
-
-            # Generate offspring
-            while len(new_population) < population_size:
-                parent1 = Selection.tournament_selection(
-                    self.population,
-                    self.fitness_evaluator.calculate_fitness,
-                    self.config.get("tournament_size", 2),
-                    self.config.get("diversity_weight", 0.1),
-                )
-                parent2 = Selection.tournament_selection(
-                    self.population,
-                    self.fitness_evaluator.calculate_fitness,
-                    self.config.get("tournament_size", 2),
-                    self.config.get("diversity_weight", 0.1),
-                )
-                child1, child2 = Crossover.single_point_crossover(
-                    parent1, parent2, self.days
-                )
-
-                mutation_rate = Mutation.adaptive_mutation_rate(
-                    generation,
-                    num_generations,
-                    self.config["initial_mutation_rate"],
-                    self.config["final_mutation_rate"],
-                )
+            for slot, individual in zip(new_population, elite):
+                slot.copy_from(individual)
 
-                Mutation.random_mutation(child1, self.subjects, mutation_rate)
-                Mutation.random_mutation(child2, self.subjects, mutation_rate)
+            # Generate offspring in place
+            mutation_rate = Mutation.adaptive_mutation_rate(
+                generation,
+                num_generations,
+                self.config["initial_mutation_rate"],
+                self.config["final_mutation_rate"],
+            )
+            if self.surrogate is not None:
+                self._breed_screened(new_population, len(elite), mutation_rate)
+            else:
+                self._breed_into(new_population, len(elite), mutation_rate)
 
-                new_population.extend([child1, child2])
+            # Swap the buffers
+            self._next_population = self.population
+            self.population = new_population
 
-            # Truncate to population size
-            self.population = new_population[:population_size]
+            # Replace clones of elites and of other offspring
+            if self.config.get("deduplicate", True):
+                self.clone_rate = Deduplication.replace_duplicates(
+                    self.population,
+                    self.population_initializer,
+                    self.subjects,
+                    self.config.get("duplicate_mutation_rate", 0.5),
+                )
 
             if verbose and generation % 10 == 0:
-                best_individual = max(
-                    self.population, key=self.fitness_evaluator.calculate_fitness
-                )
+                best_individual = self._best_individual()
                 best_fitness = self.fitness_evaluator.calculate_fitness(best_individual)
                 avg_diversity = sum(
                     ind.calculate_diversity() for ind in self.population
                 ) / len(self.population)
                 print(
-                    f"Generation {generation}: Best Fitness = {best_fitness}, Avg Diversity = {avg_diversity:.2f}"
+                    f"Generation {generation}: Best Fitness = {best_fitness}, Avg Diversity = {avg_diversity:.2f}, Clone Rate = {self.clone_rate:.2f}"
                 )
 
             if self.save_interval and generation % self.save_interval == 0:
                 self.checkpoint(f"generation_{generation}.json")
             if self.save_at_step and generation == self.save_at_step:
                 self.checkpoint(f"generation_{generation}.json")
-        return max(self.population, key=self.fitness_evaluator.calculate_fitness)
+
+            if progress_callback and generation % progress_interval == 0:
+                best_individual = self._best_individual()
+                if (
+                    progress_callback(
+                        generation,
+                        best_individual,
+                        self.fitness_evaluator.calculate_fitness(best_individual),
+                    )
+                    is False
+                ):
+                    break
+        # Copy so that later runs reusing the buffers do not overwrite the result
+        return self._best_individual().copy()
+
+    def _best_individual(self) -> Individual:
+        """Return the fittest individual of the population by exact fitness. Individuals that only
+        have a surrogate estimate are scored exactly while the estimate puts them on top.
+        """
+        while True:
+            best = max(self.population, key=self.fitness_evaluator.calculate_fitness)
+            if best.predicted_fitness is None:
+                return best
+            best.predicted_fitness = None
+
+    def evolve_on_disk(
+        self,
+        path: str,
+        max_generations=None,
+        chunk_size: int = 1024,
+        verbose=False,
+    ) -> Individual:
+        """Evolve a population stored in a memory-mapped file, for populations too large for RAM.
+        Offspring are bred chunk_size at a time: the tournament candidates of a whole chunk are drawn
+        up front and each is decoded once, so memory use is bounded by the chunk size rather than
+        the population size. The file is flushed after every generation
+        and doubles as the checkpoint: if path already holds a store, evolution resumes from it.
+        Raises ValueError if that store was written for other subjects, days, time slots or preferences.
+        Elites are chosen on fitness alone, without the diversity filter of elitism_with_diversity.
+        Args: path (str): The data file of the MemmapPopulationStore.
+              max_generations (int): The generation to stop at. Defaults to config["num_generations"].
+              chunk_size (int): The number of offspring bred per chunk.
+              verbose (bool): Whether to print progress.
+        """
+        np = import_numpy()
+        population_size = self.config["population_size"]
+        num_generations = max_generations or self.config["num_generations"]
+        tournament_size = self.config.get("tournament_size", 2)
+        diversity_weight = self.config.get("diversity_weight", 0.1)
+
+        if MemmapPopulationStore.exists(path):
+            store = MemmapPopulationStore.open(path)
+            encoder = store.encoder
+            if (
+                list(encoder.subjects) != list(self.subjects)
+                or list(encoder.days) != list(self.days)
+                or list(encoder.time_slots) != list(self.time_slots)
+            ):
+                raise ValueError(
+                    f"The store at {path} was written for other subjects, days or time slots"
+                )
+            # The stored fitness values were computed with the stored preferences
+            if store.metadata.get("preferences") != self.preferences:
+                raise ValueError(
+                    f"The store at {path} was written for other preferences"
+                )
+            population_size = len(store)
+        else:
+            store = MemmapPopulationStore.create(
+                path,
+                GenomeEncoder(self.subjects, self.days, self.time_slots),
+                population_size,
+                {"preferences": self.preferences, "config": self.config},
+            )
+            adherent_count = int(
+                population_size
+                * self.config.get("initial_preference_adherent_percentage", 0.2)
+            )
+            for index in range(population_size):
+                individual = self.population_initializer.generate_individual(
+                    consider_preferences=index < adherent_count
+                )
+                store.write(
+                    index,
+                    individual,
+                    self.fitness_evaluator.calculate_fitness(individual),
+                )
+            store.swap()
+            store.generation = 0
+            store.flush()
+
+        elite_size = int(self.config["elite_percentage"] * population_size)
+        while store.generation < num_generations:
+            generation = store.generation
+            self.current_generation = generation
+            fitness = np.asarray(store.fitness)
+
+            elite = np.argsort(fitness)[::-1][:elite_size]
+            for target, source in enumerate(elite):
+                store.copy_to_next(int(source), target)
+
+            mutation_rate = Mutation.adaptive_mutation_rate(
+                generation,
+                num_generations,
+                self.config["initial_mutation_rate"],
+                self.config["final_mutation_rate"],
+            )
+            for start in range(elite_size, population_size, chunk_size):
+                stop = min(start + chunk_size, population_size)
+                parents = self._select_stored_parents(
+                    store,
+                    fitness,
+                    2 * math.ceil((stop - start) / 2),
+                    tournament_size,
+                    diversity_weight,
+                )
+                for index in range(start, stop, 2):
+                    parent1, parent2 = (
+                        parents[index - start],
+                        parents[index - start + 1],
+                    )
+                    children = Crossover.single_point_crossover(
+                        parent1, parent2, self.days
+                    )
+                    for child, target in zip(children, range(index, stop)):
+                        Mutation.random_mutation(child, self.subjects, mutation_rate)
+                        store.write(
+                            target,
+                            child,
+                            self.fitness_evaluator.calculate_fitness(child),
+                        )
+
+            store.swap()
+            store.flush()
+
+            if verbose and generation % 10 == 0:
+                print(
+                    f"Generation {generation}: Best Fitness = {float(np.max(store.fitness))}"
+                )
+
+        return store.get(int(np.argmax(store.fitness)))
+
+    @staticmethod
+    def _select_stored_parents(
+        store: MemmapPopulationStore,
+        fitness,
+        count: int,
+        tournament_size: int,
+        diversity_weight: float,
+    ) -> List[Individual]:
+        """Run count tournaments over a MemmapPopulationStore, using the stored fitness values.
+        The candidates of all tournaments are drawn first, so each is decoded and scored once.
+        """
+        tournaments = [
+            random.sample(range(len(store)), tournament_size) for _ in range(count)
+        ]
+        decoded = {
+            index: store.get(index)
+            for index in {index for tournament in tournaments for index in tournament}
+        }
+        scores = {
+            index: fitness[index] + diversity_weight * individual.calculate_diversity()
+            for index, individual in decoded.items()
+        }
+        return [
+            decoded[max(tournament, key=scores.__getitem__)]
+            for tournament in tournaments
+        ]
+
+    def _breed_into(self, targets: List[Individual], start: int, mutation_rate: float):
+        """Overwrite targets[start:] with mutated children of tournament selected parents."""
+        for i in range(start, len(targets), 2):
+            parent1 = Selection.tournament_selection(
+                self.population,
+                self.fitness_evaluator.calculate_fitness,
+                self.config.get("tournament_size", 2),
+                self.config.get("diversity_weight", 0.1),
+            )
+            parent2 = Selection.tournament_selection(
+                self.population,
+                self.fitness_evaluator.calculate_fitness,
+                self.config.get("tournament_size", 2),
+                self.config.get("diversity_weight", 0.1),
+            )
+            child1 = targets[i]
+            child2 = targets[i + 1] if i + 1 < len(targets) else None
+            Crossover.single_point_crossover_into(
+                parent1, parent2, self.days, child1, child2
+            )
+
+            Mutation.random_mutation(child1, self.subjects, mutation_rate)
+            if child2 is not None:
+                Mutation.random_mutation(child2, self.subjects, mutation_rate)
+
+    def _breed_screened(
+        self, new_population: List[Individual], start: int, mutation_rate: float
+    ):
+        """Breed offspring into new_population[start:] and score them with the help of the surrogate.
+        While the surrogate is reliable, only the config["surrogate_fraction"] of offspring it ranks
+        best, plus a random audit sample of config["surrogate_audit_fraction"] of the others (at
+        least one) that keeps its error estimate honest, are scored exactly. The others keep their
+        estimated fitness as predicted_fitness. Otherwise all offspring are scored exactly.
+        Either way the exactly scored offspring train the surrogate.
+        """
+        self._breed_into(new_population, start, mutation_rate)
+        offspring = new_population[start:]
+        if not offspring:
+            return
+        scored = offspring
+        if self.surrogate.is_reliable:
+            estimates = self.surrogate.predict(offspring)
+            ranking = estimates.argsort()[::-1]
+            count = math.ceil(self.config["surrogate_fraction"] * len(offspring))
+            rest = [int(index) for index in ranking[count:]]
+            audit_size = min(
+                len(rest),
+                max(
+                    1,
+                    round(self.config.get("surrogate_audit_fraction", 0.1) * len(rest)),
+                ),
+            )
+            exact = {int(index) for index in ranking[:count]}
+            exact.update(random.sample(rest, audit_size))
+            scored = []
+            for index, individual in enumerate(offspring):
+                if index in exact:
+                    scored.append(individual)
+                else:
+                    individual.predicted_fitness = float(estimates[index])
+        self.surrogate.observe(
+            scored, [self.fitness_evaluator.calculate_fitness(i) for i in scored]
+        )
+
+    def _allocate_next_population(self):
+        """Make sure the spare generation buffer holds one independent individual per member
+        of the current population, reusing the existing buffer when it still fits."""
+        buffer_ids = {id(ind.timetable) for ind in self._next_population}
+        if len(self._next_population) == len(self.population) and not any(
+            id(ind.timetable) in buffer_ids for ind in self.population
+        ):
+            return
+        self._next_population = [ind.copy() for ind in self.population]
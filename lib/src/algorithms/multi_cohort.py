@@ -0,0 +1,198 @@
+import random
+from typing import Dict, List
+
+from lib.src.algorithms.fitness import FitnessEvaluator
+from lib.src.algorithms.mutatation import Mutation
+from lib.src.algorithms.population import PopulationInitializer
+from lib.src.algorithms.selection import Selection
+from lib.src.models.cohorts import MultiCohortIndividual
+
+
+class ResourceClashPenalty:
+    """Penalty for shared resources booked by several cohorts in the same slot.
+    Unlike BasePenalty it scores a whole MultiCohortIndividual, whose occupancy index keeps the
+    clash count up to date.
+    Args: weight (float): The penalty per clash.
+    """
+
+    def __init__(self, weight: float = 50):
+        self.weight = weight
+
+    def calculate(self, individual: MultiCohortIndividual) -> float:
+        return individual.clashes
+
+
+class MultiCohortFitnessEvaluator:
+    """Calculate the fitness of a MultiCohortIndividual: the sum of each cohort's own fitness
+    minus the weighted resource clash penalty. Cohort fitness values are cached on the individual
+    and only recomputed for cohorts whose slots changed.
+    Args: cohorts (Dict[str, Dict]): For each cohort, its "subjects" and "preferences".
+          time_slots (List[str]): The list of time slots.
+          clash_penalty (ResourceClashPenalty): The penalty for resource clashes.
+          debug_validation (bool): Passed to each cohort's FitnessEvaluator.
+    """
+
+    def __init__(
+        self,
+        cohorts: Dict[str, Dict],
+        time_slots: List[str],
+        clash_penalty: ResourceClashPenalty,
+        debug_validation: bool = False,
+    ):
+        self.time_slots = time_slots
+        self.clash_penalty = clash_penalty
+        self.evaluators = {
+            cohort: FitnessEvaluator(
+                problem["subjects"],
+                time_slots,
+                problem["preferences"],
+                debug_validation,
+            )
+            for cohort, problem in cohorts.items()
+        }
+
+    def calculate_fitness(self, individual: MultiCohortIndividual) -> float:
+        fitness = 0.0
+        for cohort, timetable in individual.cohorts.items():
+            cohort_fitness = individual.cohort_fitness.get(cohort)
+            if cohort_fitness is None:
+                cohort_fitness = self.evaluators[cohort].calculate_fitness(timetable)
+                individual.cohort_fitness[cohort] = cohort_fitness
+            fitness += cohort_fitness
+        penalty = self.clash_penalty.calculate(individual)
+        return fitness - penalty * self.clash_penalty.weight
+
+
+class MultiCohortTimetableGenerator:
+    """Evolve the timetables of several cohorts at once, with a single genome covering all of them,
+    so that clashes on shared teachers and rooms are penalized instead of fixed by hand.
+    Args: config (Dict): The configuration, as for TimetableGenerator. "clash_weight" sets the
+                         weight of the resource clash penalty.
+          cohorts (Dict[str, Dict]): For each cohort, its "subjects" and "preferences".
+          days (List[str]): The list of days, shared by all cohorts.
+          time_slots (List[str]): The list of time slots, shared by all cohorts.
+          resources (Dict[str, Dict[str, List[str]]]): For each cohort, the shared resources
+                        (e.g. ["teacher:Smith", "room:Lab"]) each of its subjects uses.
+    """
+
+    def __init__(
+        self,
+        config: Dict,
+        cohorts: Dict[str, Dict],
+        days: List[str],
+        time_slots: List[str],
+        resources: Dict[str, Dict[str, List[str]]],
+    ):
+        self.config = config
+        self.cohorts = cohorts
+        self.days = days
+        self.time_slots = time_slots
+        self.resources = resources
+
+        self.population_initializers = {
+            cohort: PopulationInitializer(
+                problem["subjects"], days, time_slots, problem["preferences"]
+            )
+            for cohort, problem in cohorts.items()
+        }
+        self.fitness_evaluator = MultiCohortFitnessEvaluator(
+            cohorts,
+            time_slots,
+            ResourceClashPenalty(weight=config.get("clash_weight", 50)),
+            config.get("debug_validation", False),
+        )
+
+        self.current_generation = 0
+        self.population: List[MultiCohortIndividual] = []
+
+    def generate_individual(
+        self, consider_preferences: bool = False
+    ) -> MultiCohortIndividual:
+        return MultiCohortIndividual(
+            {
+                cohort: initializer.generate_individual(consider_preferences)
+                for cohort, initializer in self.population_initializers.items()
+            },
+            self.resources,
+        )
+
+    def crossover(
+        self, parent1: MultiCohortIndividual, parent2: MultiCohortIndividual
+    ) -> MultiCohortIndividual:
+        """Uniform crossover over cohorts: the child starts as a copy of parent1 and takes each
+        cohort's timetable from parent2 with probability 0.5. Only slots that differ are written,
+        so the occupancy index is updated for the changed slots only."""
+        child = parent1.copy()
+        for cohort, timetable in parent2.cohorts.items():
+            if random.random() < 0.5:
+                for day, schedule in timetable.timetable.items():
+                    for time, subject in schedule.items():
+                        child.set_slot(cohort, day, time, subject)
+        return child
+
+    def mutate(self, individual: MultiCohortIndividual, mutation_rate: float):
+        """Randomly change the subject of slots, like Mutation.random_mutation, for every cohort."""
+        for cohort, timetable in individual.cohorts.items():
+            choices = self.cohorts[cohort]["subjects"] + ["Free"]
+            for day in self.days:
+                for time in self.time_slots:
+                    if random.random() < mutation_rate:
+                        individual.set_slot(cohort, day, time, random.choice(choices))
+
+    def evolve(self, max_generations=None, verbose=False) -> MultiCohortIndividual:
+        """Evolve the cohort timetables for the given number of generations."""
+        population_size = self.config["population_size"]
+        num_generations = max_generations or self.config["num_generations"]
+        elite_size = int(self.config["elite_percentage"] * population_size)
+        adherent_count = int(
+            population_size
+            * self.config.get("initial_preference_adherent_percentage", 0.2)
+        )
+
+        self.population = [
+            self.generate_individual(consider_preferences=i < adherent_count)
+            for i in range(population_size)
+        ]
+
+        for generation in range(num_generations):
+            self.current_generation = generation
+            new_population = sorted(
+                self.population,
+                key=self.fitness_evaluator.calculate_fitness,
+                reverse=True,
+            )[:elite_size]
+
+            mutation_rate = Mutation.adaptive_mutation_rate(
+                generation,
+                num_generations,
+                self.config["initial_mutation_rate"],
+                self.config["final_mutation_rate"],
+            )
+            while len(new_population) < population_size:
+                parent1 = Selection.tournament_selection(
+                    self.population,
+                    self.fitness_evaluator.calculate_fitness,
+                    self.config.get("tournament_size", 2),
+                    self.config.get("diversity_weight", 0.1),
+                )
+                parent2 = Selection.tournament_selection(
+                    self.population,
+                    self.fitness_evaluator.calculate_fitness,
+                    self.config.get("tournament_size", 2),
+                    self.config.get("diversity_weight", 0.1),
+                )
+                child = self.crossover(parent1, parent2)
+                self.mutate(child, mutation_rate)
+                new_population.append(child)
+
+            self.population = new_population
+
+            if verbose and generation % 10 == 0:
+                best_individual = max(
+                    self.population, key=self.fitness_evaluator.calculate_fitness
+                )
+                print(
+                    f"Generation {generation}: Best Fitness = {self.fitness_evaluator.calculate_fitness(best_individual)}, Clashes = {best_individual.clashes}"
+                )
+
+        return max(self.population, key=self.fitness_evaluator.calculate_fitness)
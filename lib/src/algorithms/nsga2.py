@@ -0,0 +1,190 @@
+import random
+from typing import Dict, List, Tuple
+
+from lib.src.algorithms.crossover import Crossover
+from lib.src.algorithms.generative_algorithm import TimetableGenerator
+from lib.src.algorithms.mutatation import Mutation
+from lib.src.models.individual import Individual
+from lib.src.utils.helpers import import_numpy
+
+
+def fast_non_dominated_sort(objectives) -> List:
+    """Split a population into Pareto fronts, all objectives being minimized.
+    Args: objectives (numpy.ndarray): The (population size, number of objectives) objective matrix.
+    Returns: List[numpy.ndarray]: The indices of each front, best front first.
+    """
+    np = import_numpy()
+    # dominates[i, j] is True when i is no worse than j on every objective and better on one
+    no_worse = (objectives[:, None, :] <= objectives[None, :, :]).all(axis=2)
+    better = (objectives[:, None, :] < objectives[None, :, :]).any(axis=2)
+    dominates = no_worse & better
+
+    domination_count = dominates.sum(axis=0)
+    assigned = np.zeros(len(objectives), dtype=bool)
+    fronts = []
+    while not assigned.all():
+        front = np.flatnonzero((domination_count == 0) & ~assigned)
+        fronts.append(front)
+        assigned[front] = True
+        domination_count = domination_count - dominates[front].sum(axis=0)
+    return fronts
+
+
+def crowding_distance(objectives):
+    """Crowding distance of every member of a front; boundary points get infinity.
+    Args: objectives (numpy.ndarray): The (front size, number of objectives) objective matrix.
+    """
+    np = import_numpy()
+    size, count = objectives.shape
+    distance = np.zeros(size)
+    if size <= 2:
+        distance[:] = np.inf
+        return distance
+
+    order = np.argsort(objectives, axis=0)
+    ordered = np.take_along_axis(objectives, order, axis=0)
+    span = ordered[-1] - ordered[0]
+    span[span == 0] = 1
+    gaps = (ordered[2:] - ordered[:-2]) / span
+    for m in range(count):
+        distance[order[1:-1, m]] += gaps[:, m]
+        distance[order[0, m]] = np.inf
+        distance[order[-1, m]] = np.inf
+    return distance
+
+
+class ParetoTimetableGenerator(TimetableGenerator):
+    """Multi-objective (NSGA-II) variant of TimetableGenerator. Each registered penalty and reward is
+    a separate, unweighted objective instead of being folded into one fitness value, and evolution
+    returns the Pareto front, so the trade-off between them can be picked after a single run.
+    """
+
+    @property
+    def objective_names(self) -> List[str]:
+        return list(self.fitness_evaluator.terms)
+
+    def calculate_objectives(self, population: List[Individual]):
+        """Return the (population size, number of objectives) matrix to minimize.
+        Penalties are used as is and rewards are negated; invalid timetables get infinity everywhere.
+        Values come from the evaluator's cached term scores, divided back by the term weights.
+        """
+        np = import_numpy()
+        terms = self.fitness_evaluator.terms
+        signs = [1.0] * len(self.fitness_evaluator.penalties.penalty_objects) + [
+            -1.0
+        ] * len(self.fitness_evaluator.rewards.rewards)
+        objectives = np.full((len(population), len(terms)), np.inf)
+        for i, individual in enumerate(population):
+            scores = self.fitness_evaluator.calculate_term_scores(individual)
+            if scores is None:
+                continue
+            objectives[i] = [
+                sign
+                * (
+                    scores[name] / term.weight
+                    if term.weight
+                    else term.calculate(
+                        individual, self.preferences, self.subjects, self.time_slots
+                    )
+                )
+                for sign, (name, term) in zip(signs, terms.items())
+            ]
+        return objectives
+
+    def _rank(self, objectives) -> Tuple:
+        """Return the front index and crowding distance of every individual."""
+        np = import_numpy()
+        rank = np.empty(len(objectives), dtype=int)
+        distance = np.empty(len(objectives))
+        for front_index, front in enumerate(fast_non_dominated_sort(objectives)):
+            rank[front] = front_index
+            distance[front] = crowding_distance(objectives[front])
+        return rank, distance
+
+    def _crowded_tournament(self, rank, distance) -> int:
+        """Binary tournament on (lowest front, then largest crowding distance)."""
+        i, j = random.sample(range(len(rank)), 2)
+        if rank[i] != rank[j]:
+            return i if rank[i] < rank[j] else j
+        return i if distance[i] >= distance[j] else j
+
+    def evolve_pareto(
+        self, max_generations=None, verbose=False
+    ) -> List[Tuple[Individual, Dict[str, float]]]:
+        """Evolve with NSGA-II and return the first Pareto front, without duplicate timetables,
+        as (individual, {objective name: value}) pairs. Reward values are reported unnegated.
+        """
+        np = import_numpy()
+        population_size = self.config["population_size"]
+        num_generations = max_generations or self.config["num_generations"]
+        names = self.objective_names
+        reward_columns = len(self.fitness_evaluator.rewards.rewards)
+
+        self.population = self.population_initializer.initialize_population(
+            population_size,
+            self.config.get("initial_preference_adherent_percentage", 0.2),
+        )
+        objectives = self.calculate_objectives(self.population)
+        rank, distance = self._rank(objectives)
+
+        for generation in range(num_generations):
+            self.current_generation = generation
+            mutation_rate = Mutation.adaptive_mutation_rate(
+                generation,
+                num_generations,
+                self.config["initial_mutation_rate"],
+                self.config["final_mutation_rate"],
+            )
+
+            offspring = []
+            while len(offspring) < population_size:
+                parent1 = self.population[self._crowded_tournament(rank, distance)]
+                parent2 = self.population[self._crowded_tournament(rank, distance)]
+                for child in Crossover.single_point_crossover(
+                    parent1, parent2, self.days
+                ):
+                    Mutation.random_mutation(child, self.subjects, mutation_rate)
+                    offspring.append(child)
+            offspring = offspring[:population_size]
+
+            # Environmental selection over parents and offspring together
+            combined = self.population + offspring
+            combined_objectives = np.vstack(
+                [objectives, self.calculate_objectives(offspring)]
+            )
+            # Survivors keep the front index and crowding distance computed here,
+            # so the next generation does not sort them again
+            selected, selected_rank, selected_distance = [], [], []
+            for front_index, front in enumerate(
+                fast_non_dominated_sort(combined_objectives)
+            ):
+                front_distance = crowding_distance(combined_objectives[front])
+                keep = np.argsort(-front_distance)[: population_size - len(selected)]
+                selected.extend(front[keep])
+                selected_rank.extend([front_index] * len(keep))
+                selected_distance.extend(front_distance[keep])
+                if len(selected) == population_size:
+                    break
+
+            self.population = [combined[i] for i in selected]
+            objectives = combined_objectives[selected]
+            rank = np.array(selected_rank)
+            distance = np.array(selected_distance)
+
+            if verbose and generation % 10 == 0:
+                print(
+                    f"Generation {generation}: Pareto Front Size = {int(np.sum(rank == 0))}"
+                )
+
+        front = []
+        seen = set()
+        for i in np.flatnonzero(rank == 0):
+            key = self.population[i].genome_key()
+            if key in seen:
+                continue
+            seen.add(key)
+            values = objectives[i].copy()
+            if reward_columns:
+                values[-reward_columns:] *= -1
+            front.append((self.population[i], dict(zip(names, values.tolist()))))
+        return front
@@ -1,6 +1,7 @@
 import random
 from typing import Dict, List
 
+from lib.src.algorithms.mutatation import Mutation
 from lib.src.models.individual import Individual
 
 
@@ -36,7 +37,11 @@ class PopulationInitializer:
         if consider_preferences:
             for subject, pref in self.preferences.items():
                 for day, time in pref.items():
-                    if time is not None and timetable[day][time] == "Free":
+                    if (
+                        time is not None
+                        and subject in self.subjects
+                        and timetable[day][time] == "Free"
+                    ):
                         timetable[day][time] = subject
                         if subject in subjects_needed:
                             subjects_needed.remove(subject)
@@ -47,7 +52,9 @@ class PopulationInitializer:
                 if timetable[day][time] == "Free" and subjects_needed:
                     timetable[day][time] = subjects_needed.pop()
 
-        return Individual(timetable)
+        individual = Individual(timetable)
+        individual.validated = True
+        return individual
 
     def initialize_population(
         self, population_size: int, preference_adherent_percentage: float
@@ -67,3 +74,19 @@ class PopulationInitializer:
         ]
 
         return preference_adherent_individuals + random_individuals
+
+    def initialize_population_with_seed(
+        self, population_size: int, seed: Individual, mutation_rate: float
+    ) -> List[Individual]:
+        """Build a population from a seed individual: the seed itself, then mutated copies of it.
+        Args:
+            population_size (int): The number of individuals.
+            seed (Individual): The individual to start from.
+            mutation_rate (float): The probability of changing each slot of a copy.
+        """
+        population = [seed.copy()]
+        while len(population) < population_size:
+            individual = seed.copy()
+            Mutation.random_mutation(individual, self.subjects, mutation_rate)
+            population.append(individual)
+        return population
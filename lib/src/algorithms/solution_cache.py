@@ -0,0 +1,225 @@
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from lib.src.models.individual import Individual
+from lib.src.utils.helpers import create_directory_if_not_exists
+
+
+def problem_fingerprint(
+    subjects: List[str],
+    days: List[str],
+    time_slots: List[str],
+    preferences: Dict,
+    config: Dict,
+) -> str:
+    """Hash of a problem that does not depend on the order of subjects, days or preferences.
+    Time slots keep their order, since penalties such as ConsecutiveClassesPenalty depend on it,
+    and preferences set to None are ignored, since they are the same as no preference.
+    """
+    canonical = {
+        "subjects": sorted(subjects),
+        "days": sorted(days),
+        "time_slots": list(time_slots),
+        "preferences": sorted(_preference_triples(preferences)),
+        "config": config,
+    }
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+
+def _preference_triples(preferences: Dict) -> List[Tuple[str, str, str]]:
+    return [
+        (subject, day, time)
+        for subject, pref in preferences.items()
+        for day, time in pref.items()
+        if time is not None
+    ]
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class SolutionCache:
+    """Disk-backed store of solved problems, keyed by problem_fingerprint, with LRU eviction.
+    Identical problems are answered from the store; for other problems with the same days and time
+    slots, the populations of the most similar stored problems seed the initial population.
+    Args: directory (str): The directory holding the entries and their index.
+          max_bytes (int): The total size of the entries above which the least recently used are evicted.
+          config_keys (List[str]): The config keys that are part of the fingerprint. Defaults to all.
+          max_neighbours (int): The number of similar entries used to seed a population.
+          min_similarity (float): The similarity (0 to 1) below which entries are not used as seeds.
+          seed_fraction (float): The largest fraction of the initial population taken from seeds.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 100 * 1024 * 1024,
+        config_keys: Optional[List[str]] = None,
+        max_neighbours: int = 3,
+        min_similarity: float = 0.5,
+        seed_fraction: float = 0.5,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.config_keys = config_keys
+        self.max_neighbours = max_neighbours
+        self.min_similarity = min_similarity
+        self.seed_fraction = seed_fraction
+        self.hits = 0
+        self.misses = 0
+        create_directory_if_not_exists(directory)
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(self.index, f)
+        os.replace(f"{path}.tmp", path)
+
+    def _entry_path(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, f"{fingerprint}.json")
+
+    def fingerprint(self, generator, max_generations: Optional[int] = None) -> str:
+        """Fingerprint of the generator's problem, including max_generations when it overrides
+        config["num_generations"], since it changes the result."""
+        config = generator.config
+        if self.config_keys is not None:
+            config = {key: config.get(key) for key in self.config_keys}
+        if max_generations is not None:
+            config = {**config, "max_generations": max_generations}
+        return problem_fingerprint(
+            generator.subjects,
+            generator.days,
+            generator.time_slots,
+            generator.preferences,
+            config,
+        )
+
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        """Return the stored entry ("best", "fitness", "population") and mark it as recently used."""
+        if fingerprint not in self.index:
+            return None
+        with open(self._entry_path(fingerprint), "r") as f:
+            entry = json.load(f)
+        self.index[fingerprint]["last_used"] = time.time()
+        self._save_index()
+        return entry
+
+    def put(self, fingerprint: str, generator, best: Individual, fitness: float):
+        """Store the best individual and the final population of a solved problem."""
+        entry = {
+            "best": best.timetable,
+            "fitness": fitness,
+            "population": [ind.timetable for ind in generator.population],
+        }
+        path = self._entry_path(fingerprint)
+        with open(path, "w") as f:
+            json.dump(entry, f)
+        self.index[fingerprint] = {
+            "subjects": generator.subjects,
+            "days": generator.days,
+            "time_slots": generator.time_slots,
+            "preferences": _preference_triples(generator.preferences),
+            "size": os.path.getsize(path),
+            "last_used": time.time(),
+        }
+        self._evict()
+        self._save_index()
+
+    def _evict(self):
+        total = sum(meta["size"] for meta in self.index.values())
+        for fingerprint in sorted(self.index, key=lambda f: self.index[f]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self.index.pop(fingerprint)["size"]
+            os.remove(self._entry_path(fingerprint))
+
+    def nearest(self, generator) -> List[Tuple[float, str]]:
+        """Return (similarity, fingerprint) of the most similar stored problems with the same days
+        and time slots, best first. Similarity averages the Jaccard index of the subjects and of the
+        (subject, day, time) preferences."""
+        subjects = set(generator.subjects)
+        preferences = set(_preference_triples(generator.preferences))
+        candidates = []
+        for fingerprint, meta in self.index.items():
+            if set(meta["days"]) != set(generator.days) or list(
+                meta["time_slots"]
+            ) != list(generator.time_slots):
+                continue
+            similarity = (
+                _jaccard(subjects, set(meta["subjects"]))
+                + _jaccard(preferences, {tuple(p) for p in meta["preferences"]})
+            ) / 2
+            if similarity >= self.min_similarity:
+                candidates.append((similarity, fingerprint))
+        candidates.sort(reverse=True)
+        return candidates[: self.max_neighbours]
+
+    def seed_population(self, generator) -> List[Individual]:
+        """Build a seed population from the populations of the nearest stored problems, most
+        similar first. Subjects unknown to the generator are replaced by "Free"."""
+        seeds = []
+        known = set(generator.subjects)
+        for _, fingerprint in self.nearest(generator):
+            entry = self.get(fingerprint)
+            for timetable in entry["population"]:
+                seeds.append(
+                    Individual(
+                        {
+                            day: {
+                                time: (
+                                    timetable[day][time]
+                                    if timetable[day][time] in known
+                                    else "Free"
+                                )
+                                for time in generator.time_slots
+                            }
+                            for day in generator.days
+                        }
+                    )
+                )
+        return seeds[: int(generator.config["population_size"] * self.seed_fraction)]
+
+    def solve(
+        self, generator, max_generations: Optional[int] = None, verbose=False
+    ) -> Individual:
+        """Return the stored solution of the generator's problem if there is one, otherwise evolve,
+        seeded from similar stored problems, and store the result.
+        Args: generator (TimetableGenerator): The generator of the problem.
+              max_generations (int): Passed to evolve, and part of the fingerprint.
+              verbose (bool): Passed to evolve.
+        """
+        fingerprint = self.fingerprint(generator, max_generations)
+        entry = self.get(fingerprint)
+        if entry is not None:
+            self.hits += 1
+            return Individual(entry["best"])
+
+        self.misses += 1
+        best = generator.evolve(
+            max_generations=max_generations,
+            verbose=verbose,
+            initial_population=self.seed_population(generator),
+        )
+        self.put(
+            fingerprint,
+            generator,
+            best,
+            generator.fitness_evaluator.calculate_fitness(best),
+        )
+        return best
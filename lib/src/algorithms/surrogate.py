@@ -0,0 +1,117 @@
+import math
+from typing import List, Optional
+
+from lib.src.models.individual import Individual
+from lib.src.utils.helpers import import_numpy
+
+
+class SurrogateModel:
+    """Cheap ridge regression estimate of the fitness, trained on exactly scored individuals.
+    Features are the number of slots each subject (and "Free") takes on each day. The error of the
+    predictions against exact scores is tracked as a moving average, relative to the spread of the
+    training fitness values, and the model is only reliable while that error stays below max_error.
+    Args: subjects (List[str]): The list of subjects.
+          days (List[str]): The list of days.
+          alpha (float): The ridge regularization strength.
+          max_samples (int): The number of most recent samples kept for training.
+          max_error (float): The relative error above which the model is not reliable.
+          error_smoothing (float): The weight of the latest batch in the error moving average.
+    """
+
+    def __init__(
+        self,
+        subjects: List[str],
+        days: List[str],
+        alpha: float = 1.0,
+        max_samples: int = 5000,
+        max_error: float = 0.5,
+        error_smoothing: float = 0.2,
+    ):
+        np = import_numpy()
+        self.alpha = alpha
+        self.max_samples = max_samples
+        self.max_error = max_error
+        self.error_smoothing = error_smoothing
+        names = list(subjects) + ["Free"]
+        self.feature_index = {
+            (day, subject): d * len(names) + s
+            for d, day in enumerate(days)
+            for s, subject in enumerate(names)
+        }
+        # One feature per (day, subject) plus the intercept
+        self.num_features = len(self.feature_index) + 1
+        self.min_samples = 2 * self.num_features
+        self.samples = np.zeros((max_samples, self.num_features))
+        self.targets = np.zeros(max_samples)
+        self.num_samples = 0
+        self.weights = None
+        self.error: Optional[float] = None
+
+    @property
+    def is_reliable(self) -> bool:
+        return (
+            self.weights is not None
+            and self.error is not None
+            and self.error <= self.max_error
+        )
+
+    def features(self, individuals: List[Individual]):
+        np = import_numpy()
+        features = np.zeros((len(individuals), self.num_features))
+        features[:, -1] = 1
+        for i, individual in enumerate(individuals):
+            row = features[i]
+            for day, schedule in individual.timetable.items():
+                for subject in schedule.values():
+                    index = self.feature_index.get((day, subject))
+                    if index is not None:
+                        row[index] += 1
+        return features
+
+    def predict(self, individuals: List[Individual]):
+        """Return the estimated fitness of each individual as a numpy array."""
+        return self.features(individuals) @ self.weights
+
+    def observe(self, individuals: List[Individual], fitness_values: List[float]):
+        """Update the error estimate with the exact fitness of individuals, then add them to the
+        training samples and refit. Invalid individuals (infinite fitness) are ignored.
+        """
+        np = import_numpy()
+        kept = [
+            (individual, fitness)
+            for individual, fitness in zip(individuals, fitness_values)
+            if math.isfinite(fitness)
+        ]
+        if not kept:
+            return
+        features = self.features([individual for individual, _ in kept])
+        targets = np.array([fitness for _, fitness in kept])
+
+        if self.weights is not None:
+            spread = float(np.std(self.targets[: self.num_samples])) or 1.0
+            error = float(np.mean(np.abs(features @ self.weights - targets))) / spread
+            self.error = (
+                error
+                if self.error is None
+                else (1 - self.error_smoothing) * self.error
+                + self.error_smoothing * error
+            )
+
+        for row, target in zip(features, targets):
+            index = self.num_samples % self.max_samples
+            self.samples[index] = row
+            self.targets[index] = target
+            self.num_samples += 1
+        self.fit()
+
+    def fit(self):
+        np = import_numpy()
+        count = min(self.num_samples, self.max_samples)
+        if count < self.min_samples:
+            return
+        samples, targets = self.samples[:count], self.targets[:count]
+        regularization = self.alpha * np.eye(self.num_features)
+        regularization[-1, -1] = 0  # Do not shrink the intercept
+        self.weights = np.linalg.solve(
+            samples.T @ samples + regularization, samples.T @ targets
+        )
@@ -0,0 +1,185 @@
+import itertools
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from lib.src.algorithms.generative_algorithm import TimetableGenerator
+from lib.src.models.individual import Individual
+
+
+def sample_configurations(
+    search_space: Dict[str, List],
+    base_config: Dict,
+    num_samples: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> List[Dict]:
+    """Build the configurations to try from a search space.
+    Args: search_space (Dict[str, List]): The candidate values of each config key, e.g.
+                                          {"population_size": [50, 100], "tournament_size": [2, 3, 5]}.
+          base_config (Dict): The values of every key not in the search space.
+          num_samples (int): The number of configurations drawn at random from the grid.
+                             Defaults to the full grid.
+          seed (int): The seed used to draw the samples.
+    """
+    keys = list(search_space)
+    grid = [
+        dict(zip(keys, values)) for values in itertools.product(*search_space.values())
+    ]
+    if num_samples is not None and num_samples < len(grid):
+        grid = random.Random(seed).sample(grid, num_samples)
+    return [{**base_config, **params} for params in grid]
+
+
+def run_trial(
+    config: Dict,
+    problem: Dict,
+    start_generation: int,
+    end_generation: int,
+    max_generations: int,
+    population: Optional[List[Dict]] = None,
+) -> Tuple[float, List[Dict]]:
+    """Evolve one configuration on one problem from start_generation to end_generation, resuming
+    from population (a list of timetables) if given. The mutation rate follows the schedule of a
+    full run of max_generations generations, so every rung sees the rates a real run would.
+    Returns the best fitness reached and the final population, to resume from at the next rung.
+    """
+    ga = TimetableGenerator(
+        config=config,
+        subjects=problem["subjects"],
+        days=problem["days"],
+        time_slots=problem["time_slots"],
+        preferences=problem["preferences"],
+    )
+    best = ga.evolve(
+        start_generation=start_generation,
+        max_generations=max_generations,
+        stop_generation=end_generation,
+        initial_population=[Individual(timetable) for timetable in population or []],
+    )
+    return (
+        ga.fitness_evaluator.calculate_fitness(best),
+        [individual.timetable for individual in ga.population],
+    )
+
+
+class SuccessiveHalvingSweep:
+    """Tune a configuration by successive halving: every configuration runs on every problem for
+    min_generations generations, then only the best 1 / eta of them (by mean best fitness over the
+    problems) continue, from where they stopped, for eta times as many generations, and so on until
+    max_generations is reached or a single configuration is left. Trials run in a process pool.
+    Args: search_space (Dict[str, List]): The candidate values of each config key, see sample_configurations.
+          problems (List[Dict]): The problems, each with subjects, days, time_slots and preferences.
+          base_config (Dict): The values of every key not in the search space.
+          workers (int): The number of worker processes. Defaults to the number of CPUs.
+          min_generations (int): The generation budget of the first rung.
+          max_generations (int): The largest generation budget. Defaults to base_config["num_generations"].
+          eta (int): The reduction factor between rungs.
+          num_samples (int): The number of configurations to sample, see sample_configurations.
+          seed (int): The seed used to sample configurations.
+    """
+
+    def __init__(
+        self,
+        search_space: Dict[str, List],
+        problems: List[Dict],
+        base_config: Dict,
+        workers: Optional[int] = None,
+        min_generations: int = 20,
+        max_generations: Optional[int] = None,
+        eta: int = 2,
+        num_samples: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        assert eta >= 2, "eta must be >= 2"
+        self.search_space = search_space
+        self.problems = problems
+        self.base_config = base_config
+        self.workers = workers or os.cpu_count() or 1
+        self.min_generations = min_generations
+        self.max_generations = max_generations or base_config["num_generations"]
+        self.eta = eta
+        self.configurations = sample_configurations(
+            search_space, base_config, num_samples, seed
+        )
+
+    def run(self, verbose=False) -> List[Dict]:
+        """Run the sweep and return one row per configuration, best first. Each row holds the rank,
+        the swept "params", the mean best "fitness" at the last rung the configuration reached
+        and that rung's "generations" budget."""
+        rows = [
+            {
+                "params": {key: config[key] for key in self.search_space},
+                "fitness": float("-inf"),
+                "generations": 0,
+            }
+            for config in self.configurations
+        ]
+        populations: Dict[Tuple[int, int], List[Dict]] = {}
+        alive = list(range(len(self.configurations)))
+        start, budget = 0, min(self.min_generations, self.max_generations)
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                futures = {
+                    (c, p): executor.submit(
+                        run_trial,
+                        self.configurations[c],
+                        problem,
+                        start,
+                        budget,
+                        self.max_generations,
+                        populations.get((c, p)),
+                    )
+                    for c in alive
+                    for p, problem in enumerate(self.problems)
+                }
+                scores = {c: [] for c in alive}
+                for (c, p), future in futures.items():
+                    fitness, populations[(c, p)] = future.result()
+                    scores[c].append(fitness)
+                for c in alive:
+                    rows[c]["fitness"] = sum(scores[c]) / len(scores[c])
+                    rows[c]["generations"] = budget
+
+                alive.sort(key=lambda c: rows[c]["fitness"], reverse=True)
+                if verbose:
+                    best = rows[alive[0]]
+                    print(
+                        f"Rung {budget} generations: {len(alive)} configurations, Best Fitness = {best['fitness']:.2f}, Params = {best['params']}"
+                    )
+                if len(alive) == 1 or budget >= self.max_generations:
+                    break
+
+                keep = max(1, math.ceil(len(alive) / self.eta))
+                for c in alive[keep:]:
+                    for p in range(len(self.problems)):
+                        del populations[(c, p)]
+                alive = alive[:keep]
+                start, budget = budget, min(budget * self.eta, self.max_generations)
+
+        ranked = sorted(
+            rows, key=lambda row: (row["generations"], row["fitness"]), reverse=True
+        )
+        for rank, row in enumerate(ranked, start=1):
+            row["rank"] = rank
+        return ranked
+
+
+def format_table(rows: List[Dict]) -> str:
+    """Format the rows returned by SuccessiveHalvingSweep.run as a plain text table."""
+    if not rows:
+        return ""
+    keys = list(rows[0]["params"])
+    header = ["rank", "fitness", "generations"] + keys
+    lines = [
+        [str(row["rank"]), f"{row['fitness']:.2f}", str(row["generations"])]
+        + [str(row["params"][key]) for key in keys]
+        for row in rows
+    ]
+    widths = [max(len(cell) for cell in column) for column in zip(header, *lines)]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip()
+        for line in [header] + lines
+    )
@@ -0,0 +1,92 @@
+"""Solve timetabling problems read as JSON lines and stream each solution back as a JSON line.
+
+    python -m lib.src.cli problems.jsonl --config config.json --workers 4 > solutions.jsonl
+
+Each input line is a problem as accepted by solve_many (subjects, days, time_slots, preferences,
+optional id and config). Output lines are written as soon as each problem is solved, in completion
+order. The exit status is 1 if any line could not be solved. Keys missing from both the --config
+file and a problem's own config take their value from DEFAULT_CONFIG in lib.src.algorithms.batch.
+The solver is only imported once the arguments are parsed, so --help and argument errors stay fast.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterator, List, Optional, TextIO
+
+
+def read_problems(stream: TextIO, output: TextIO, errors: List[Dict]) -> Iterator[Dict]:
+    """Yield the problems of a JSON lines stream one at a time. Blank lines are skipped and lines
+    that are not a JSON object are reported on output, and appended to errors, instead of being solved.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            problem = json.loads(line)
+            if not isinstance(problem, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            error = {"line": line_number, "error": f"Invalid JSON: {e}"}
+            errors.append(error)
+            write_result(output, error)
+            continue
+        problem.setdefault("id", line_number)
+        yield problem
+
+
+def write_result(output: TextIO, result: Dict):
+    output.write(json.dumps(result) + "\n")
+    output.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Solve timetabling problems from JSON lines"
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="JSON lines file, - for stdin"
+    )
+    parser.add_argument("-o", "--output", default="-", help="output file, - for stdout")
+    parser.add_argument(
+        "--config", help="JSON file overriding keys of the default configuration"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes, 1 solves in this process",
+    )
+    parser.add_argument("--max-generations", type=int)
+    args = parser.parse_args(argv)
+
+    config = {}
+    if args.config:
+        with open(args.config, "r") as f:
+            config = json.load(f)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r")
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    errors = []
+    try:
+        from lib.src.algorithms.batch import solve_many
+
+        for result in solve_many(
+            read_problems(source, output, errors),
+            workers=args.workers,
+            config=config,
+            max_generations=args.max_generations,
+        ):
+            if "error" in result:
+                errors.append(result)
+            write_result(output, result)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+from typing import Dict, List, Optional, Tuple
+
+from lib.src.models.individual import Individual
+
+
+class ResourceOccupancyIndex:
+    """Count, for every (day, time) slot, how many cohorts use each shared resource (teacher, room...).
+    The number of clashes, i.e. extra bookings of an already booked resource, is kept up to date
+    on every add/remove, so reading it is O(1) and updating it is O(resources of the changed slot).
+    """
+
+    def __init__(self):
+        self.occupancy: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self.clashes = 0
+
+    def add(self, day: str, time: str, resources: List[str]):
+        slot = self.occupancy.setdefault((day, time), {})
+        for resource in resources:
+            count = slot.get(resource, 0)
+            if count > 0:
+                self.clashes += 1
+            slot[resource] = count + 1
+
+    def remove(self, day: str, time: str, resources: List[str]):
+        slot = self.occupancy[(day, time)]
+        for resource in resources:
+            count = slot[resource]
+            if count > 1:
+                self.clashes -= 1
+                slot[resource] = count - 1
+            else:
+                del slot[resource]
+
+    def copy(self) -> "ResourceOccupancyIndex":
+        index = ResourceOccupancyIndex()
+        index.occupancy = {slot: dict(usage) for slot, usage in self.occupancy.items()}
+        index.clashes = self.clashes
+        return index
+
+
+class MultiCohortIndividual:
+    """A genome holding one timetable per cohort, plus the occupancy index of their shared resources.
+    Slots must be changed through set_slot so that the index and the cached per-cohort fitness
+    values stay consistent.
+    Args: cohorts (Dict[str, Individual]): The timetable of each cohort.
+          resources (Dict[str, Dict[str, List[str]]]): For each cohort, the resources each subject uses.
+    """
+
+    def __init__(
+        self,
+        cohorts: Dict[str, Individual],
+        resources: Dict[str, Dict[str, List[str]]],
+        index: Optional[ResourceOccupancyIndex] = None,
+    ):
+        self.cohorts = cohorts
+        self.resources = resources
+        # Fitness of each cohort's own timetable, dropped when one of its slots changes
+        self.cohort_fitness: Dict[str, float] = {}
+        if index is None:
+            index = ResourceOccupancyIndex()
+            for cohort, individual in cohorts.items():
+                for day, schedule in individual.timetable.items():
+                    for time, subject in schedule.items():
+                        index.add(day, time, self.get_resources(cohort, subject))
+        self.index = index
+
+    @property
+    def clashes(self) -> int:
+        return self.index.clashes
+
+    def get_resources(self, cohort: str, subject: str) -> List[str]:
+        return self.resources.get(cohort, {}).get(subject, [])
+
+    def get_slot(self, cohort: str, day: str, time: str) -> str:
+        return self.cohorts[cohort].get_slot(day, time)
+
+    def set_slot(self, cohort: str, day: str, time: str, subject: str):
+        previous = self.cohorts[cohort].get_slot(day, time)
+        if previous == subject:
+            return
+        self.index.remove(day, time, self.get_resources(cohort, previous))
+        self.index.add(day, time, self.get_resources(cohort, subject))
+        self.cohorts[cohort].set_slot(day, time, subject)
+        self.cohort_fitness.pop(cohort, None)
+
+    def copy(self) -> "MultiCohortIndividual":
+        individual = MultiCohortIndividual(
+            {cohort: ind.copy() for cohort, ind in self.cohorts.items()},
+            self.resources,
+            self.index.copy(),
+        )
+        individual.cohort_fitness = dict(self.cohort_fitness)
+        return individual
+
+    def calculate_diversity(self) -> float:
+        return sum(ind.calculate_diversity() for ind in self.cohorts.values()) / len(
+            self.cohorts
+        )
+
+    def to_timetables(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        return {cohort: ind.timetable for cohort, ind in self.cohorts.items()}
@@ -0,0 +1,48 @@
+from typing import List, Sequence
+
+from lib.src.models.individual import Individual
+
+
+class GenomeEncoder:
+    """Encode timetables as flat lists of integer subject codes and back.
+    Slots are laid out day by day in the order of days and time_slots. Code 0 is "Free",
+    code i + 1 is subjects[i].
+    Args: subjects (List[str]): The list of subjects.
+          days (List[str]): The list of days.
+          time_slots (List[str]): The list of time slots.
+    """
+
+    FREE_CODE = 0
+
+    def __init__(self, subjects: List[str], days: List[str], time_slots: List[str]):
+        self.subjects = subjects
+        self.days = days
+        self.time_slots = time_slots
+        self.codes = {"Free": self.FREE_CODE}
+        for i, subject in enumerate(subjects):
+            self.codes[subject] = i + 1
+        self.names = ["Free"] + list(subjects)
+
+    @property
+    def genome_length(self) -> int:
+        return len(self.days) * len(self.time_slots)
+
+    def encode(self, individual: Individual) -> List[int]:
+        return [
+            self.codes[individual.timetable[day][time]]
+            for day in self.days
+            for time in self.time_slots
+        ]
+
+    def decode(self, codes: Sequence[int]) -> Individual:
+        slots_per_day = len(self.time_slots)
+        timetable = {}
+        for d, day in enumerate(self.days):
+            offset = d * slots_per_day
+            timetable[day] = {
+                time: self.names[int(codes[offset + t])]
+                for t, time in enumerate(self.time_slots)
+            }
+        individual = Individual(timetable)
+        individual.validated = True
+        return individual
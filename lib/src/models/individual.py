@@ -1,4 +1,6 @@
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+from lib.src.utils.bitset import slot_bits
 
 
 class Individual:
@@ -10,12 +12,77 @@ class Individual:
             for subject in day.values()
             if subject != "Free"
         }
+        # Per day bitset of the occupied (not "Free") slots, bit i being the i-th slot of the
+        # first day's schedule. Kept up to date by set_slot, copy_from and the crossover operators.
+        # Slots missing from the first day have no bit, so a malformed timetable can still be built
+        # and then rejected by the validator. TimetableGenerator.validate_input puts every day in
+        # the problem's slot order, so that all individuals of a problem share the same bits.
+        first_day = next(iter(timetable.values()), {})
+        self.slot_bits = slot_bits(list(first_day))
+        self.occupancy = {
+            day: self.calculate_occupancy(schedule)
+            for day, schedule in timetable.items()
+        }
+        # Weighted penalty/reward scores cached by the evaluator that computed them,
+        # dropped whenever a slot changes
+        self.term_scores: Dict[str, float] = {}
+        self.scored_by: Optional[object] = None
+        # Fitness estimated by a surrogate model, used in place of the exact fitness until the
+        # individual is scored or one of its slots changes
+        self.predicted_fitness: Optional[float] = None
+        # True once the timetable is known to have the problem's shape and only known subjects,
+        # either by construction (the engine's operators) or by an input check. set_slot keeps it,
+        # so callers must only assign subjects of the problem or "Free".
+        self.validated = False
+
+    def invalidate_scores(self):
+        if self.term_scores:
+            self.term_scores.clear()
+        self.scored_by = None
+        self.predicted_fitness = None
 
     def get_slot(self, day: str, time: str) -> str:
         return self.timetable.get(day).get(time)
 
+    def calculate_occupancy(self, schedule: Dict[str, str]) -> int:
+        bits = 0
+        for time, subject in schedule.items():
+            if subject != "Free":
+                bits |= self.slot_bits.get(time, 0)
+        return bits
+
     def set_slot(self, day: str, time: str, subject: str):
         self.timetable[day][time] = subject
+        if subject == "Free":
+            self.occupancy[day] &= ~self.slot_bits.get(time, 0)
+        else:
+            self.occupancy[day] |= self.slot_bits.get(time, 0)
+        self.invalidate_scores()
+
+    def copy(self) -> "Individual":
+        individual = Individual(
+            {day: dict(slots) for day, slots in self.timetable.items()}
+        )
+        individual.term_scores = dict(self.term_scores)
+        individual.scored_by = self.scored_by
+        individual.predicted_fitness = self.predicted_fitness
+        individual.validated = self.validated
+        return individual
+
+    def copy_from(self, other: "Individual"):
+        "Overwrite this individual's slots with the slots of other, reusing the existing dicts"
+        for day, slots in other.timetable.items():
+            self.timetable[day].update(slots)
+            self.occupancy[day] = other.occupancy[day]
+        self.term_scores.clear()
+        self.term_scores.update(other.term_scores)
+        self.scored_by = other.scored_by
+        self.predicted_fitness = other.predicted_fitness
+        self.validated = other.validated
+
+    def genome_key(self) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+        "The slot assignments as a hashable tuple, equal only for individuals with identical timetables"
+        return tuple(tuple(day.items()) for day in self.timetable.values())
 
     def calculate_diversity(self) -> float:
         "Checks the number of unique subjects in the timetable"
@@ -2,11 +2,14 @@ from typing import Dict, List
 
 from lib.src.models.individual import Individual
 from lib.src.models.penalties.penalty import Penalties, BasePenalty
+from lib.src.utils.bitset import excess_run_length, gap_spread, popcount
 
 
 class PreferencePenalty(BasePenalty):
     """Penalty for not satisfying preferences"""
 
+    depends_on_preferences = True
+
     def __init__(self, weight: float = 5):
         self.weight = weight
 
@@ -68,17 +71,10 @@ class ConsecutiveClassesPenalty(BasePenalty):
         subjects: List[str],
         time_slots: List[str],
     ) -> float:
-        penalty = 0
-        for day, schedule in individual.timetable.items():
-            consecutive_count = 0
-            for slot in schedule.values():
-                if slot != "Free":
-                    consecutive_count += 1
-                else:
-                    consecutive_count = 0
-                if consecutive_count > 2:
-                    penalty += consecutive_count - 2
-        return penalty
+        # For each slot in a run of more than 2 classes, add how far the run exceeds 2 so far
+        return sum(
+            excess_run_length(occupied, 2) for occupied in individual.occupancy.values()
+        )
 
 
 class FreeTimeDistributionPenalty(BasePenalty):
@@ -94,18 +90,11 @@ class FreeTimeDistributionPenalty(BasePenalty):
         subjects: List[str],
         time_slots: List[str],
     ) -> float:
-        penalty = 0
-        for day, schedule in individual.timetable.items():
-            free_slots = []
-            for i, slot in enumerate(schedule.values()):
-                if slot == "Free":
-                    free_slots.append(i)
-            if len(free_slots) > 1:
-                distances = []
-                for i in range(len(free_slots) - 1):
-                    distances.append(free_slots[i + 1] - free_slots[i])
-                penalty += max(distances) - min(distances)
-        return penalty
+        all_slots = (1 << len(individual.slot_bits)) - 1
+        return sum(
+            gap_spread(all_slots & ~occupied)
+            for occupied in individual.occupancy.values()
+        )
 
 
 class SubjectExhaustionPenalty(BasePenalty):
@@ -201,15 +190,12 @@ class FreeTimePenalty(BasePenalty):
         subjects: List[str],
         time_slots: List[str],
     ) -> float:
-        penalty = 0
-        for day, schedule in individual.timetable.items():
-            free_slots = []
-            for i, slot in enumerate(schedule.values()):
-                if slot == "Free":
-                    free_slots.append(i)
-            if len(free_slots) < 2:
-                penalty += 1
-        return penalty
+        all_slots = (1 << len(individual.slot_bits)) - 1
+        return sum(
+            1
+            for occupied in individual.occupancy.values()
+            if popcount(all_slots & ~occupied) < 2
+        )
 
 
 penalty_objects = [
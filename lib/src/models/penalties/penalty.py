@@ -5,6 +5,9 @@ from lib.src.models.individual import Individual
 
 
 class BasePenalty(ABC):
+    # Whether the penalty reads the preferences, i.e. must be recomputed when they change
+    depends_on_preferences = False
+
     def __init__(self, weight: float):
         self.weight = weight
 
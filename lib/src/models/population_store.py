@@ -0,0 +1,128 @@
+import json
+import os
+from typing import Dict, Optional
+
+from lib.src.models.encoding import GenomeEncoder
+from lib.src.models.individual import Individual
+from lib.src.utils.helpers import import_numpy
+
+
+class MemmapPopulationStore:
+    """Population storage backed by a numpy.memmap file instead of in-memory Individuals.
+    The file holds two buffers of fixed size records (encoded genome + fitness): the current
+    generation and the next one being written. A JSON sidecar (path + ".json") records the
+    problem definition, the generation and which buffer is current, so the pair of files
+    doubles as a checkpoint that can be reopened with MemmapPopulationStore.open.
+    Args: path (str): The data file.
+          encoder (GenomeEncoder): The encoder used for the genomes.
+          size (int): The number of individuals per generation.
+          metadata (Dict): Extra JSON serializable state saved in the sidecar, e.g. preferences and config.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encoder: GenomeEncoder,
+        size: int,
+        metadata: Optional[Dict] = None,
+        current: int = 0,
+        generation: int = 0,
+        mode: str = "r+",
+    ):
+        np = import_numpy()
+        self.path = path
+        self.encoder = encoder
+        self.size = size
+        self.metadata = metadata or {}
+        self.current = current
+        self.generation = generation
+        self.dtype = np.dtype(
+            [
+                ("genome", np.uint16, (encoder.genome_length,)),
+                ("fitness", np.float64),
+            ]
+        )
+        self.records = np.memmap(path, dtype=self.dtype, mode=mode, shape=(2, size))
+
+    @classmethod
+    def create(
+        cls,
+        path: str,
+        encoder: GenomeEncoder,
+        size: int,
+        metadata: Optional[Dict] = None,
+    ) -> "MemmapPopulationStore":
+        """Create a new, empty store, overwriting any existing file."""
+        store = cls(path, encoder, size, metadata, mode="w+")
+        store.records["fitness"] = float("-inf")
+        store.flush()
+        return store
+
+    @classmethod
+    def open(cls, path: str) -> "MemmapPopulationStore":
+        """Open a store previously written by create/flush."""
+        with open(cls.metadata_path(path), "r") as f:
+            state = json.load(f)
+        encoder = GenomeEncoder(state["subjects"], state["days"], state["time_slots"])
+        return cls(
+            path,
+            encoder,
+            state["size"],
+            state["metadata"],
+            current=state["current"],
+            generation=state["generation"],
+        )
+
+    @staticmethod
+    def metadata_path(path: str) -> str:
+        return f"{path}.json"
+
+    @staticmethod
+    def exists(path: str) -> bool:
+        return os.path.exists(path) and os.path.exists(
+            MemmapPopulationStore.metadata_path(path)
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def fitness(self):
+        """The fitness values of the current generation as a numpy array view."""
+        return self.records[self.current]["fitness"]
+
+    def get(self, index: int) -> Individual:
+        """Decode the individual at index in the current generation."""
+        return self.encoder.decode(self.records[self.current][index]["genome"])
+
+    def write(self, index: int, individual: Individual, fitness: float):
+        """Write an individual into the next generation buffer."""
+        record = self.records[1 - self.current][index]
+        record["genome"] = self.encoder.encode(individual)
+        record["fitness"] = fitness
+
+    def copy_to_next(self, source: int, target: int):
+        """Copy an individual of the current generation into the next one without decoding it."""
+        self.records[1 - self.current][target] = self.records[self.current][source]
+
+    def swap(self):
+        """Make the next generation buffer the current one."""
+        self.current = 1 - self.current
+        self.generation += 1
+
+    def flush(self):
+        """Write the records to disk, then the sidecar, so the sidecar never points to a partial generation."""
+        self.records.flush()
+        state = {
+            "subjects": self.encoder.subjects,
+            "days": self.encoder.days,
+            "time_slots": self.encoder.time_slots,
+            "size": self.size,
+            "current": self.current,
+            "generation": self.generation,
+            "metadata": self.metadata,
+        }
+        temp_path = f"{self.metadata_path(self.path)}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(state, f, indent=4)
+        os.replace(temp_path, self.metadata_path(self.path))
@@ -4,6 +4,8 @@ from lib.src.models.rewards.reward import BaseReward
 
 
 class PreffredSlotReward(BaseReward):
+    depends_on_preferences = True
+
     def __init__(self, weight: float):
         self.weight = weight
 
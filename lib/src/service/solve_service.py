@@ -0,0 +1,400 @@
+"""Asyncio service that solves timetabling jobs on a bounded process pool.
+
+Run it with
+    python -m lib.src.service.solve_service --port 8080 --config config.json
+or with --unix-socket PATH. Jobs use DEFAULT_CONFIG from lib.src.algorithms.batch, overridden by
+the keys of the --config file and then by the job's own "config". HTTP API (JSON bodies):
+    POST   /jobs              submit {"subjects", "days", "time_slots", "preferences",
+                              optional "config", "max_generations", "deadline_seconds"}
+                              -> 202 {"id"}, or 503 when the queue is full
+    GET    /jobs/<id>         status, progress and best-so-far result
+    GET    /jobs/<id>/events  stream of JSON lines, one per progress update, until the job ends
+    DELETE /jobs/<id>         cancel a queued or running job
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from lib.src.algorithms.batch import DEFAULT_CONFIG
+from lib.src.algorithms.generative_algorithm import TimetableGenerator
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMED_OUT = "timed_out"
+FINISHED_STATES = (DONE, FAILED, CANCELLED, TIMED_OUT)
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the job queue is full."""
+
+
+def run_job(
+    problem: Dict,
+    config: Dict,
+    progress_queue,
+    cancel_event,
+    deadline: Optional[float],
+    progress_interval: int,
+) -> Dict:
+    """Solve a job in a worker process. Progress updates are put on progress_queue and evolution
+    stops as soon as cancel_event is set or the deadline (a time.time() value) has passed.
+    """
+    stop_reason = {}
+
+    def on_progress(generation, best_individual, best_fitness):
+        progress_queue.put(
+            {
+                "generation": generation,
+                "fitness": best_fitness,
+                "timetable": best_individual.timetable,
+            }
+        )
+        if cancel_event.is_set():
+            stop_reason["status"] = CANCELLED
+            return False
+        if deadline is not None and time.time() > deadline:
+            stop_reason["status"] = TIMED_OUT
+            return False
+        return True
+
+    ga = TimetableGenerator(
+        config={**DEFAULT_CONFIG, **config, **problem.get("config", {})},
+        subjects=problem["subjects"],
+        days=problem["days"],
+        time_slots=problem["time_slots"],
+        preferences=problem["preferences"],
+    )
+    best = ga.evolve(
+        max_generations=problem.get("max_generations"),
+        progress_callback=on_progress,
+        progress_interval=progress_interval,
+    )
+    return {
+        "status": stop_reason.get("status", DONE),
+        "generation": ga.current_generation,
+        "fitness": ga.fitness_evaluator.calculate_fitness(best),
+        "timetable": best.timetable,
+    }
+
+
+class Job:
+    def __init__(self, job_id: str, problem: Dict, deadline: Optional[float]):
+        self.id = job_id
+        self.problem = problem
+        self.deadline = deadline
+        self.status = QUEUED
+        self.progress: Optional[Dict] = None
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.cancel_event = None
+        self.updated = asyncio.Condition()
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "deadline": self.deadline,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+        }
+
+    async def update(self, **changes):
+        async with self.updated:
+            for name, value in changes.items():
+                setattr(self, name, value)
+            self.updated.notify_all()
+
+
+class SolveService:
+    """Queue solve jobs onto a bounded process pool and track their progress.
+    Args: config (Dict): The configuration, merged over DEFAULT_CONFIG and overridden per job
+                         by job["config"].
+          workers (int): The number of worker processes, i.e. of jobs solved concurrently.
+          max_queue (int): The number of jobs that may wait for a worker before submissions are rejected.
+          progress_interval (int): The number of generations between progress updates.
+          max_finished (int): The number of finished jobs kept for status queries.
+    """
+
+    def __init__(
+        self,
+        config: Dict,
+        workers: int = 2,
+        max_queue: int = 100,
+        progress_interval: int = 10,
+        max_finished: int = 1000,
+    ):
+        self.config = config
+        self.workers = workers
+        self.progress_interval = progress_interval
+        self.max_finished = max_finished
+        self.queue: "asyncio.Queue[Job]" = asyncio.Queue(maxsize=max_queue)
+        self.jobs: Dict[str, Job] = {}
+        self._ids = itertools.count(1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        # Spawn rather than fork, so workers do not inherit the listening socket
+        context = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=context
+        )
+        self._manager = context.Manager()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def stop(self):
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        for job in self.jobs.values():
+            if job.cancel_event is not None:
+                job.cancel_event.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._manager.shutdown()
+
+    def submit(self, problem: Dict, deadline_seconds: Optional[float] = None) -> Job:
+        """Queue a job. Raises QueueFullError instead of waiting when the queue is full."""
+        if self.queue.full():
+            raise QueueFullError(f"Job queue is full ({self.queue.maxsize} jobs)")
+        deadline = time.time() + deadline_seconds if deadline_seconds else None
+        job = Job(str(next(self._ids)), problem, deadline)
+        self.queue.put_nowait(job)
+        self.jobs[job.id] = job
+        self._forget_finished_jobs()
+        return job
+
+    async def cancel(self, job: Job):
+        if job.status == QUEUED:
+            await job.update(status=CANCELLED)
+        elif job.status == RUNNING:
+            job.cancel_event.set()
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            try:
+                if job.status != QUEUED:
+                    continue
+                if job.deadline is not None and time.time() > job.deadline:
+                    await job.update(status=TIMED_OUT)
+                    continue
+                await self._run(loop, job)
+            finally:
+                self.queue.task_done()
+
+    async def _run(self, loop: asyncio.AbstractEventLoop, job: Job):
+        progress_queue = self._manager.Queue()
+        job.cancel_event = self._manager.Event()
+        await job.update(status=RUNNING)
+        reader = asyncio.create_task(self._read_progress(loop, job, progress_queue))
+        try:
+            result = await loop.run_in_executor(
+                self._executor,
+                run_job,
+                job.problem,
+                self.config,
+                progress_queue,
+                job.cancel_event,
+                job.deadline,
+                self.progress_interval,
+            )
+        except Exception as e:
+            await job.update(status=FAILED, error=f"{type(e).__name__}: {e}")
+        else:
+            await job.update(status=result.pop("status"), result=result)
+        finally:
+            progress_queue.put(None)
+            await reader
+
+    async def _read_progress(self, loop: asyncio.AbstractEventLoop, job: Job, queue):
+        while True:
+            progress = await loop.run_in_executor(None, queue.get)
+            if progress is None:
+                return
+            await job.update(progress=progress)
+
+    def _forget_finished_jobs(self):
+        finished = [job for job in self.jobs.values() if job.status in FINISHED_STATES]
+        for job in finished[: max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job.id]
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """Serve a single HTTP/1.1 request, then close the connection."""
+        try:
+            method, path, body = await self._read_request(reader)
+            await self._route(method, path, body, writer)
+        except (ValueError, KeyError) as e:
+            self._write_response(writer, 400, {"error": str(e)})
+        except ConnectionError:
+            pass
+        except Exception as e:
+            self._write_response(writer, 500, {"error": f"{type(e).__name__}: {e}"})
+        finally:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        request_line = (await reader.readline()).decode().split()
+        if len(request_line) < 2:
+            raise ValueError("Malformed request line")
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode().strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+        return request_line[0].upper(), request_line[1], body
+
+    async def _route(
+        self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter
+    ):
+        parts = [part for part in path.split("?")[0].split("/") if part]
+        if parts == ["jobs"] and method == "POST":
+            problem = json.loads(body or b"{}")
+            for key in ("subjects", "days", "time_slots", "preferences"):
+                if key not in problem:
+                    raise KeyError(f"Missing problem field: {key}")
+            try:
+                job = self.submit(problem, problem.pop("deadline_seconds", None))
+            except QueueFullError as e:
+                self._write_response(
+                    writer, 503, {"error": str(e)}, {"Retry-After": "5"}
+                )
+                return
+            self._write_response(writer, 202, {"id": job.id})
+            return
+
+        if len(parts) < 2 or parts[0] != "jobs" or parts[1] not in self.jobs:
+            self._write_response(writer, 404, {"error": "Not found"})
+            return
+        job = self.jobs[parts[1]]
+
+        if len(parts) == 2 and method == "GET":
+            self._write_response(writer, 200, job.to_dict())
+        elif len(parts) == 2 and method == "DELETE":
+            await self.cancel(job)
+            self._write_response(writer, 202, job.to_dict())
+        elif parts[2:] == ["events"] and method == "GET":
+            await self._stream_events(job, writer)
+        else:
+            self._write_response(writer, 405, {"error": "Method not allowed"})
+
+    async def _stream_events(self, job: Job, writer: asyncio.StreamWriter):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        last_sent = None
+        while True:
+            async with job.updated:
+                if job.status not in FINISHED_STATES and job.to_dict() == last_sent:
+                    await job.updated.wait()
+                state = job.to_dict()
+            if state != last_sent:
+                writer.write(json.dumps(state).encode() + b"\n")
+                await writer.drain()
+                last_sent = state
+            if state["status"] in FINISHED_STATES:
+                return
+
+    @staticmethod
+    def _write_response(
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Dict,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        reasons = {
+            200: "OK",
+            202: "Accepted",
+            400: "Bad Request",
+            404: "Not Found",
+            405: "Method Not Allowed",
+            500: "Internal Server Error",
+            503: "Service Unavailable",
+        }
+        body = json.dumps(payload).encode()
+        head = [
+            f"HTTP/1.1 {status} {reasons[status]}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            "Connection: close",
+        ]
+        head += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write("\r\n".join(head).encode() + b"\r\n\r\n" + body)
+
+
+async def serve(
+    service: SolveService,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    unix_socket: Optional[str] = None,
+):
+    """Run the service until cancelled, over TCP or, if unix_socket is given, a Unix socket."""
+    await service.start()
+    if unix_socket:
+        server = await asyncio.start_unix_server(service.handle_connection, unix_socket)
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Timetable solve service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix-socket")
+    parser.add_argument(
+        "--config", help="JSON file overriding keys of the default configuration"
+    )
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=100)
+    parser.add_argument("--progress-interval", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    config = {}
+    if args.config:
+        with open(args.config, "r") as f:
+            config = json.load(f)
+
+    async def run():
+        service = SolveService(
+            config, args.workers, args.max_queue, args.progress_interval
+        )
+        await serve(service, args.host, args.port, args.unix_socket)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
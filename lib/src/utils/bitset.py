@@ -0,0 +1,75 @@
+from typing import Dict, Sequence, Tuple
+
+# Slot name -> bit, shared by every timetable with the same time slots
+_SLOT_BITS: Dict[Tuple[str, ...], Dict[str, int]] = {}
+
+
+def slot_bits(time_slots: Sequence[str]) -> Dict[str, int]:
+    """Map each time slot to its bit, 1 << position in time_slots."""
+    key = tuple(time_slots)
+    bits = _SLOT_BITS.get(key)
+    if bits is None:
+        bits = {time: 1 << i for i, time in enumerate(key)}
+        _SLOT_BITS[key] = bits
+    return bits
+
+
+try:
+    popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+
+    def popcount(bits: int) -> int:
+        return bin(bits).count("1")
+
+
+def excess_run_length(bits: int, max_run: int) -> int:
+    """Sum, over every set bit, of how far the run of set bits ending there exceeds max_run.
+    A run of length n > max_run therefore counts 1 + 2 + ... + (n - max_run)."""
+    # runs has a bit set where the run ending there is longer than max_run so far
+    runs = bits
+    for _ in range(max_run):
+        runs &= runs << 1
+    total = 0
+    while runs:
+        total += popcount(runs)
+        runs &= runs << 1
+    return total
+
+
+def count_runs(bits: int) -> int:
+    """Number of runs of consecutive set bits."""
+    return popcount(bits & ~(bits << 1))
+
+
+def gap_spread(bits: int) -> int:
+    """Difference between the largest and the smallest distance between consecutive set bits,
+    0 if fewer than two bits are set. The gaps are the runs of unset bits between the lowest and
+    the highest set bit, so the cost grows with the gap lengths, not with the number of bits.
+    """
+    if popcount(bits) < 2:
+        return 0
+    lowest = (bits & -bits).bit_length() - 1
+    highest = bits.bit_length() - 1
+    # Unset bits strictly between the lowest and the highest set bit
+    between = ((1 << highest) - 1) & ~((2 << lowest) - 1) & ~bits
+    if not between:
+        return 0
+
+    # Longest gap: the number of times between can be eroded before it vanishes
+    runs, longest = between, 0
+    while runs:
+        longest += 1
+        runs &= runs >> 1
+
+    # Shortest gap: 0 if two set bits are adjacent, otherwise the first erosion that loses a run
+    if bits & (bits >> 1):
+        shortest = 0
+    else:
+        runs, shortest = between, 1
+        run_count = count_runs(between)
+        while True:
+            runs &= runs << 1
+            if count_runs(runs) < run_count:
+                break
+            shortest += 1
+    return longest - shortest
@@ -3,3 +3,14 @@ def create_directory_if_not_exists(directory):
 
     if not os.path.exists(directory):
         os.makedirs(directory)
+
+
+def import_numpy():
+    """Import numpy, which is only needed by the optional array based features."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for this feature, install it with `pip install numpy`"
+        ) from e
+    return numpy
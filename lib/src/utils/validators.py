@@ -8,11 +8,12 @@ class TimetableValidator:
     def is_valid(
         individual: Individual, subjects: List[str], time_slots: List[str]
     ) -> bool:
+        slots = set(time_slots)
+        allowed = set(subjects)
+        allowed.add("Free")
         for day in individual.timetable.values():
-            if set(day.keys()) != set(time_slots):
+            if day.keys() != slots:
                 return False
-            if not all(
-                subject in subjects or subject == "Free" for subject in day.values()
-            ):
+            if not allowed.issuperset(day.values()):
                 return False
         return True
@@ -0,0 +1,51 @@
+import unittest
+
+from lib.src.algorithms.batch import solve_many
+
+CONFIG = {"population_size": 10, "num_generations": 3}
+
+
+def make_problem(problem_id, subjects=("Math", "Science")):
+    return {
+        "id": problem_id,
+        "subjects": list(subjects),
+        "days": ["Monday", "Tuesday"],
+        "time_slots": ["09:00", "10:00"],
+        "preferences": {},
+    }
+
+
+class TestSolveMany(unittest.TestCase):
+    def test_in_process_results_follow_input_order(self):
+        problems = [make_problem(f"p{i}") for i in range(4)]
+        results = list(solve_many(problems, workers=1, config=CONFIG))
+        self.assertEqual([r["id"] for r in results], ["p0", "p1", "p2", "p3"])
+        self.assertEqual([r["index"] for r in results], [0, 1, 2, 3])
+        for result in results:
+            self.assertIn("timetable", result)
+            self.assertGreaterEqual(result["elapsed"], 0)
+
+    def test_default_configuration(self):
+        (result,) = solve_many([make_problem("p")], workers=1, max_generations=2)
+        self.assertNotIn("error", result)
+
+    def test_errors_are_reported_per_problem(self):
+        broken = make_problem("broken")
+        del broken["preferences"]
+        results = list(
+            solve_many([make_problem("ok"), broken], workers=1, config=CONFIG)
+        )
+        self.assertNotIn("error", results[0])
+        self.assertEqual(results[1]["error"], "KeyError: 'preferences'")
+
+    def test_process_pool_solves_every_problem(self):
+        problems = [make_problem(f"p{i}") for i in range(6)]
+        problems[2]["config"] = {"population_size": "not a number"}
+        results = list(solve_many(iter(problems), workers=2, config=CONFIG))
+        self.assertEqual(sorted(r["index"] for r in results), list(range(6)))
+        failed = [r["id"] for r in results if "error" in r]
+        self.assertEqual(failed, ["p2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import random
+import unittest
+
+from lib.src.models.individual import Individual
+from lib.src.models.penalties.penalties import (
+    ConsecutiveClassesPenalty,
+    FreeTimeDistributionPenalty,
+    FreeTimePenalty,
+)
+from lib.src.utils.bitset import excess_run_length, gap_spread
+
+SUBJECTS = ["Math", "Science", "English", "History"]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+
+
+def reference_excess_run_length(bits: int, max_run: int) -> int:
+    total, run = 0, 0
+    while bits:
+        run = run + 1 if bits & 1 else 0
+        total += max(0, run - max_run)
+        bits >>= 1
+    return total
+
+
+def reference_gap_spread(bits: int) -> int:
+    positions = [i for i in range(bits.bit_length()) if bits >> i & 1]
+    if len(positions) < 2:
+        return 0
+    gaps = [b - a for a, b in zip(positions, positions[1:])]
+    return max(gaps) - min(gaps)
+
+
+def reference_consecutive_classes(individual: Individual) -> int:
+    penalty = 0
+    for schedule in individual.timetable.values():
+        run = 0
+        for subject in schedule.values():
+            run = run + 1 if subject != "Free" else 0
+            if run > 2:
+                penalty += run - 2
+    return penalty
+
+
+def free_positions(schedule):
+    return [i for i, subject in enumerate(schedule.values()) if subject == "Free"]
+
+
+def reference_free_time(individual: Individual) -> int:
+    return sum(
+        1
+        for schedule in individual.timetable.values()
+        if len(free_positions(schedule)) < 2
+    )
+
+
+def reference_free_time_distribution(individual: Individual) -> int:
+    penalty = 0
+    for schedule in individual.timetable.values():
+        free = free_positions(schedule)
+        if len(free) > 1:
+            gaps = [b - a for a, b in zip(free, free[1:])]
+            penalty += max(gaps) - min(gaps)
+    return penalty
+
+
+def random_individual(rng: random.Random, time_slots) -> Individual:
+    free_probability = rng.random()
+    return Individual(
+        {
+            day: {
+                time: (
+                    "Free" if rng.random() < free_probability else rng.choice(SUBJECTS)
+                )
+                for time in time_slots
+            }
+            for day in DAYS
+        }
+    )
+
+
+class TestBitset(unittest.TestCase):
+    def test_excess_run_length(self):
+        self.assertEqual(excess_run_length(0, 2), 0)
+        self.assertEqual(excess_run_length(0b111, 2), 1)
+        self.assertEqual(excess_run_length(0b11110111, 2), 1 + 2 + 1)
+        rng = random.Random(0)
+        for _ in range(500):
+            bits = rng.getrandbits(96)
+            max_run = rng.randint(0, 5)
+            self.assertEqual(
+                excess_run_length(bits, max_run),
+                reference_excess_run_length(bits, max_run),
+            )
+
+    def test_gap_spread(self):
+        self.assertEqual(gap_spread(0), 0)
+        self.assertEqual(gap_spread(0b1000), 0)
+        self.assertEqual(gap_spread(0b10101), 0)
+        self.assertEqual(gap_spread(0b1000011), 4)
+        rng = random.Random(1)
+        for _ in range(500):
+            bits = rng.getrandbits(96) & rng.getrandbits(96)
+            self.assertEqual(gap_spread(bits), reference_gap_spread(bits))
+
+
+class TestBitsetPenalties(unittest.TestCase):
+    def assert_matches_reference(self, time_slots):
+        rng = random.Random(len(time_slots))
+        for _ in range(200):
+            individual = random_individual(rng, time_slots)
+            arguments = (individual, {}, SUBJECTS, time_slots)
+            self.assertEqual(
+                ConsecutiveClassesPenalty().calculate(*arguments),
+                reference_consecutive_classes(individual),
+            )
+            self.assertEqual(
+                FreeTimePenalty().calculate(*arguments),
+                reference_free_time(individual),
+            )
+            self.assertEqual(
+                FreeTimeDistributionPenalty().calculate(*arguments),
+                reference_free_time_distribution(individual),
+            )
+
+    def test_five_slots(self):
+        self.assert_matches_reference(["15:00", "17:00", "18:00", "20:00", "21:00"])
+
+    def test_ninety_six_slots(self):
+        self.assert_matches_reference(
+            [f"{i // 4:02}:{i % 4 * 15:02}" for i in range(96)]
+        )
+
+    def test_occupancy_follows_set_slot(self):
+        time_slots = ["09:00", "10:00", "11:00"]
+        individual = random_individual(random.Random(2), time_slots)
+        individual.set_slot("Monday", "10:00", "Math")
+        individual.set_slot("Monday", "11:00", "Free")
+        self.assertEqual(
+            individual.occupancy["Monday"],
+            individual.calculate_occupancy(individual.timetable["Monday"]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from lib.src.cli import main, read_problems
+
+PROBLEM = {
+    "subjects": ["Math", "Science"],
+    "days": ["Monday", "Tuesday"],
+    "time_slots": ["09:00", "10:00"],
+    "preferences": {},
+}
+
+
+class TestReadProblems(unittest.TestCase):
+    def test_skips_blank_lines_and_reports_invalid_ones(self):
+        stream = io.StringIO(
+            json.dumps(PROBLEM) + "\n\n[1, 2]\nnot json\n" + json.dumps(PROBLEM) + "\n"
+        )
+        output, errors = io.StringIO(), []
+        problems = list(read_problems(stream, output, errors))
+        self.assertEqual([problem["id"] for problem in problems], [1, 5])
+        self.assertEqual([error["line"] for error in errors], [3, 4])
+        reported = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(reported, errors)
+
+    def test_keeps_given_ids(self):
+        stream = io.StringIO(json.dumps({**PROBLEM, "id": "cohort-a"}) + "\n")
+        (problem,) = read_problems(stream, io.StringIO(), [])
+        self.assertEqual(problem["id"], "cohort-a")
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_lines(self, name, lines):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    def run_main(self, lines, *arguments):
+        source = self.write_lines("problems.jsonl", lines)
+        output = os.path.join(self.directory.name, "solutions.jsonl")
+        status = main([source, "-o", output, *arguments])
+        with open(output) as f:
+            return status, [json.loads(line) for line in f]
+
+    def test_solves_every_line_in_order(self):
+        problems = [json.dumps({**PROBLEM, "id": i}) for i in range(3)]
+        status, results = self.run_main(problems, "--max-generations", "2")
+        self.assertEqual(status, 0)
+        self.assertEqual([result["id"] for result in results], [0, 1, 2])
+        self.assertTrue(all("timetable" in result for result in results))
+
+    def test_config_file_and_exit_status(self):
+        config = self.write_lines("config.json", [json.dumps({"num_generations": 2})])
+        broken = {key: value for key, value in PROBLEM.items() if key != "days"}
+        status, results = self.run_main(
+            [json.dumps(PROBLEM), "{", json.dumps(broken)], "--config", config
+        )
+        self.assertEqual(status, 1)
+        self.assertEqual(len(results), 3)
+        self.assertIn("timetable", results[0])
+        self.assertIn("Invalid JSON", results[1]["error"])
+        self.assertEqual(results[2]["error"], "KeyError: 'days'")
+
+
+if __name__ == "__main__":
+    unittest.main()
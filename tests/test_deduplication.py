@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from lib.src.algorithms.deduplication import Deduplication
+from lib.src.algorithms.population import PopulationInitializer
+
+SUBJECTS = ["Math", "Science", "English"]
+DAYS = ["Monday", "Tuesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00"]
+
+
+class TestReplaceDuplicates(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.initializer = PopulationInitializer(SUBJECTS, DAYS, TIME_SLOTS, {})
+
+    def test_empty_population(self):
+        self.assertEqual(
+            Deduplication.replace_duplicates([], self.initializer, SUBJECTS, 0.5), 0.0
+        )
+
+    def test_clones_are_replaced_and_first_occurrence_kept(self):
+        elite = self.initializer.generate_individual()
+        other = self.initializer.generate_individual()
+        population = [elite.copy(), elite.copy(), other.copy(), elite.copy()]
+        clone_rate = Deduplication.replace_duplicates(
+            population, self.initializer, SUBJECTS, 0.5
+        )
+        self.assertEqual(clone_rate, 0.5)
+        self.assertEqual(population[0].timetable, elite.timetable)
+        keys = [individual.genome_key() for individual in population]
+        self.assertEqual(len(set(keys)), len(keys))
+
+    def test_falls_back_to_fresh_individual(self):
+        individual = self.initializer.generate_individual()
+        population = [individual.copy(), individual.copy()]
+        fresh = self.initializer.generate_individual()
+        self.initializer.generate_individual = lambda: fresh.copy()
+        # A zero mutation rate never changes the clone, so it must be replaced
+        clone_rate = Deduplication.replace_duplicates(
+            population, self.initializer, SUBJECTS, 0.0
+        )
+        self.assertEqual(clone_rate, 0.5)
+        self.assertEqual(population[1].timetable, fresh.timetable)
+        self.assertEqual(
+            population[1].occupancy,
+            {day: fresh.calculate_occupancy(s) for day, s in fresh.timetable.items()},
+        )
+
+    def test_genome_key_distinguishes_timetables(self):
+        first = self.initializer.generate_individual()
+        second = first.copy()
+        self.assertEqual(first.genome_key(), second.genome_key())
+        second.set_slot("Monday", "09:00", "Free")
+        self.assertNotEqual(first.genome_key(), second.genome_key())
+
+
+if __name__ == "__main__":
+    unittest.main()
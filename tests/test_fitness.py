@@ -0,0 +1,78 @@
+import random
+import unittest
+
+from lib.src.algorithms.crossover import Crossover
+from lib.src.algorithms.fitness import FitnessEvaluator
+from lib.src.algorithms.population import PopulationInitializer
+from lib.src.models.penalties.penalties import FreeTimePenalty
+
+SUBJECTS = ["Math", "Science", "English", "History"]
+DAYS = ["Monday", "Tuesday", "Wednesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00", "12:00"]
+PREFERENCES = {"Math": {"Monday": "09:00"}, "Science": {"Tuesday": "10:00"}}
+
+
+class TestTermScoreCache(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.evaluator = FitnessEvaluator(SUBJECTS, TIME_SLOTS, PREFERENCES)
+        self.initializer = PopulationInitializer(
+            SUBJECTS, DAYS, TIME_SLOTS, PREFERENCES
+        )
+
+    def uncached_fitness(self, individual) -> float:
+        arguments = (individual, PREFERENCES, SUBJECTS, TIME_SLOTS)
+        return (
+            1000
+            - self.evaluator.penalties.calculate_total_penalty(*arguments)
+            + self.evaluator.rewards.calculate_total_reward(*arguments)
+        )
+
+    def test_set_slot_invalidates_scores(self):
+        individual = self.initializer.generate_individual()
+        self.evaluator.calculate_fitness(individual)
+        self.assertTrue(individual.term_scores)
+        individual.set_slot("Monday", "09:00", "Free")
+        self.assertEqual(individual.term_scores, {})
+        self.assertIsNone(individual.scored_by)
+        self.assertEqual(
+            self.evaluator.calculate_fitness(individual),
+            self.uncached_fitness(individual),
+        )
+
+    def test_copy_from_copies_scores(self):
+        source = self.initializer.generate_individual()
+        target = self.initializer.generate_individual()
+        self.evaluator.calculate_fitness(source)
+        self.evaluator.calculate_fitness(target)
+        target.copy_from(source)
+        self.assertEqual(target.term_scores, source.term_scores)
+        self.assertIsNot(target.term_scores, source.term_scores)
+        self.assertEqual(
+            self.evaluator.calculate_fitness(target), self.uncached_fitness(target)
+        )
+
+    def test_crossover_into_invalidates_children(self):
+        parents = [self.initializer.generate_individual() for _ in range(2)]
+        children = [self.initializer.generate_individual() for _ in range(2)]
+        for individual in parents + children:
+            self.evaluator.calculate_fitness(individual)
+        Crossover.single_point_crossover_into(*parents, DAYS, *children)
+        for child in children:
+            self.assertIsNone(child.scored_by)
+            self.assertEqual(
+                self.evaluator.calculate_fitness(child), self.uncached_fitness(child)
+            )
+
+    def test_repeated_term_class_keeps_both_scores(self):
+        self.evaluator.penalties.register_penalty(FreeTimePenalty(weight=100))
+        for _ in range(20):
+            individual = self.initializer.generate_individual()
+            self.assertEqual(
+                self.evaluator.calculate_fitness(individual),
+                self.uncached_fitness(individual),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
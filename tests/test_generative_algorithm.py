@@ -0,0 +1,183 @@
+import random
+import unittest
+from unittest import mock
+
+from lib.src.algorithms.generative_algorithm import TimetableGenerator
+from lib.src.models.individual import Individual
+
+SUBJECTS = ["Math", "Science", "English", "History"]
+DAYS = ["Monday", "Tuesday", "Wednesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00", "12:00"]
+PREFERENCES = {"Math": {"Monday": "09:00"}}
+CONFIG = {
+    "population_size": 12,
+    "num_generations": 5,
+    "elite_percentage": 0.25,
+    "initial_mutation_rate": 0.3,
+    "final_mutation_rate": 0.01,
+    "tournament_size": 3,
+    "diversity_weight": 2,
+    "diversity_threshold": 0.5,
+}
+
+
+def make_generator(**config) -> TimetableGenerator:
+    return TimetableGenerator(
+        {**CONFIG, **config}, SUBJECTS, DAYS, TIME_SLOTS, PREFERENCES
+    )
+
+
+def day_ids(population):
+    return [
+        id(day) for individual in population for day in individual.timetable.values()
+    ]
+
+
+class TestPopulationBuffers(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def assert_independent(self, generator):
+        current = day_ids(generator.population)
+        spare = day_ids(generator._next_population)
+        self.assertEqual(len(set(current)), len(current))
+        self.assertEqual(len(set(spare)), len(spare))
+        self.assertFalse(set(current) & set(spare))
+
+    def test_buffers_do_not_share_day_dicts(self):
+        generator = make_generator()
+        generator.evolve()
+        self.assertEqual(len(generator._next_population), len(generator.population))
+        self.assert_independent(generator)
+
+    def test_resumed_run_keeps_buffers_independent(self):
+        generator = make_generator()
+        generator.evolve(max_generations=2)
+        generator.evolve(
+            initial_population=generator.population,
+            start_generation=2,
+            max_generations=4,
+        )
+        self.assert_independent(generator)
+
+    def test_returned_best_is_not_a_buffer(self):
+        generator = make_generator()
+        best = generator.evolve()
+        timetable = {day: dict(slots) for day, slots in best.timetable.items()}
+        generator.evolve(initial_population=generator.population)
+        self.assertEqual(best.timetable, timetable)
+
+    def test_elites_survive_breeding(self):
+        generator = make_generator(num_generations=30)
+        best = []
+        generator.evolve(
+            progress_callback=lambda generation, individual, value: best.append(value),
+            progress_interval=1,
+        )
+        self.assertEqual(best, sorted(best))
+
+
+class TestInputValidation(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+
+    def test_seeds_from_another_problem_are_rejected(self):
+        other = TimetableGenerator(CONFIG, ["Art", "Music"], DAYS, TIME_SLOTS, {})
+        other.evolve(max_generations=1)
+        generator = make_generator()
+        with self.assertRaises(ValueError):
+            generator.evolve(initial_population=other.population)
+        with self.assertRaises(ValueError):
+            generator.evolve(initial_solution=other.population[0])
+
+    def test_initial_solution_seeds_the_population(self):
+        seed = make_generator().population_initializer.generate_individual()
+        generator = make_generator(num_generations=1)
+        generator.evolve(initial_solution=seed)
+        self.assertEqual(len(generator.population), CONFIG["population_size"])
+
+    def test_invalid_partial_solution_is_rejected(self):
+        generator = make_generator()
+        with self.assertRaises(ValueError):
+            generator.complete_partial_solution({"Monday": {"09:00": "Art"}})
+        generator.initialize_from_partial_state({"Monday": {"09:00": "Math"}})
+        for individual in generator.population:
+            self.assertEqual(individual.get_slot("Monday", "09:00"), "Math")
+
+    def test_inputs_are_put_in_problem_order(self):
+        generator = make_generator()
+        seed = generator.population_initializer.generate_individual()
+        shuffled = Individual(
+            {
+                day: dict(reversed(list(seed.timetable[day].items())))
+                for day in reversed(DAYS)
+            }
+        )
+        validated = generator.validate_input(shuffled, "test")
+        self.assertEqual(list(validated.timetable), DAYS)
+        for day in DAYS:
+            self.assertEqual(list(validated.timetable[day]), TIME_SLOTS)
+            self.assertEqual(validated.timetable[day], seed.timetable[day])
+        self.assertEqual(validated.occupancy, seed.occupancy)
+        self.assertTrue(validated.validated)
+
+
+class TestReoptimize(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.generator = make_generator()
+        self.generator.evolve()
+        self.state = self.generator.get_state()
+
+    def count_term_calls(self):
+        """Count the calculate calls of every registered term, by term name."""
+        calls = {}
+        for name, term in self.generator.fitness_evaluator.terms.items():
+            calls[name] = 0
+
+            def counting(*args, name=name, calculate=term.calculate):
+                calls[name] += 1
+                return calculate(*args)
+
+            term.calculate = counting
+            self.addCleanup(delattr, term, "calculate")
+        return calls
+
+    def reoptimize(self, preferences):
+        # Every evaluator registers the same term objects, so the new one's calls are counted too
+        self.calls = self.count_term_calls()
+        with mock.patch.object(self.generator, "evolve") as evolve:
+            evolve.return_value = "evolved"
+            result = self.generator.reoptimize(self.state, preferences)
+        return result, evolve
+
+    def test_unchanged_preferences_skip_the_search(self):
+        preferences = {**PREFERENCES, "Science": {"Monday": None}}
+        result, evolve = self.reoptimize(preferences)
+        evolve.assert_not_called()
+        self.assertEqual(sum(self.calls.values()), 0)
+        self.assertEqual(
+            result.timetable,
+            max(
+                self.generator.population,
+                key=self.generator.fitness_evaluator.calculate_fitness,
+            ).timetable,
+        )
+
+    def test_only_preference_terms_are_recomputed(self):
+        result, evolve = self.reoptimize({"Math": {"Tuesday": "10:00"}})
+        self.assertEqual(result, "evolved")
+        evolve.assert_called_once()
+        terms = self.generator.fitness_evaluator.terms
+        population_size = len(self.state["population"])
+        for name, count in self.calls.items():
+            expected = population_size if terms[name].depends_on_preferences else 0
+            self.assertEqual(count, expected, name)
+
+    def test_other_changes_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.generator.reoptimize({**self.state, "days": ["Monday"]}, PREFERENCES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from lib.src.algorithms.fitness import FitnessEvaluator
+from lib.src.models.individual import Individual
+
+SUBJECTS = ["Math", "Science"]
+DAYS = ["Monday", "Tuesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00"]
+
+
+def make_timetable(subject="Math"):
+    return {day: {time: subject for time in TIME_SLOTS} for day in DAYS}
+
+
+class TestIndividual(unittest.TestCase):
+    def test_mismatched_slots_are_built_and_scored_invalid(self):
+        timetable = make_timetable()
+        timetable["Tuesday"]["99:00"] = "Math"
+        individual = Individual(timetable)
+        evaluator = FitnessEvaluator(SUBJECTS, TIME_SLOTS, {})
+        self.assertEqual(evaluator.calculate_fitness(individual), float("-inf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from lib.src.algorithms.multi_cohort import (
+    MultiCohortTimetableGenerator,
+    ResourceClashPenalty,
+)
+
+SUBJECTS = ["Math", "Science", "English"]
+DAYS = ["Monday", "Tuesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00"]
+COHORTS = {f"class{i}": {"subjects": SUBJECTS, "preferences": {}} for i in range(4)}
+# Teachers are shared by every cohort, each cohort has its own room
+RESOURCES = {
+    cohort: {subject: [f"teacher:{subject}", f"room:{cohort}"] for subject in SUBJECTS}
+    for cohort in COHORTS
+}
+CONFIG = {
+    "population_size": 10,
+    "num_generations": 5,
+    "elite_percentage": 0.2,
+    "initial_mutation_rate": 0.3,
+    "final_mutation_rate": 0.01,
+}
+
+
+def count_clashes(individual) -> int:
+    bookings = {}
+    for cohort, timetable in individual.cohorts.items():
+        for day, schedule in timetable.timetable.items():
+            for time, subject in schedule.items():
+                for resource in RESOURCES[cohort].get(subject, []):
+                    key = (day, time, resource)
+                    bookings[key] = bookings.get(key, 0) + 1
+    return sum(count - 1 for count in bookings.values() if count > 1)
+
+
+class TestResourceOccupancyIndex(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.generator = MultiCohortTimetableGenerator(
+            CONFIG, COHORTS, DAYS, TIME_SLOTS, RESOURCES
+        )
+
+    def test_clashes_follow_set_slot(self):
+        individual = self.generator.generate_individual()
+        self.assertEqual(individual.clashes, count_clashes(individual))
+        for _ in range(200):
+            individual.set_slot(
+                random.choice(list(COHORTS)),
+                random.choice(DAYS),
+                random.choice(TIME_SLOTS),
+                random.choice(SUBJECTS + ["Free"]),
+            )
+            self.assertEqual(individual.clashes, count_clashes(individual))
+
+    def test_clashes_follow_crossover_and_mutation(self):
+        parents = [self.generator.generate_individual() for _ in range(2)]
+        for _ in range(20):
+            child = self.generator.crossover(*parents)
+            self.generator.mutate(child, 0.3)
+            self.assertEqual(child.clashes, count_clashes(child))
+            for parent in parents:
+                self.assertEqual(parent.clashes, count_clashes(parent))
+            parents = [parents[1], child]
+
+    def test_evolved_population_and_penalty(self):
+        self.generator.evolve()
+        for individual in self.generator.population:
+            self.assertEqual(individual.clashes, count_clashes(individual))
+            self.assertEqual(
+                ResourceClashPenalty().calculate(individual), individual.clashes
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import importlib.util
+import random
+import unittest
+
+from lib.src.algorithms.nsga2 import (
+    ParetoTimetableGenerator,
+    crowding_distance,
+    fast_non_dominated_sort,
+)
+
+SUBJECTS = ["Math", "Science", "English"]
+DAYS = ["Monday", "Tuesday", "Wednesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00"]
+PREFERENCES = {"Math": {"Monday": "09:00"}, "Science": {"Tuesday": "10:00"}}
+CONFIG = {
+    "population_size": 16,
+    "num_generations": 8,
+    "initial_mutation_rate": 0.3,
+    "final_mutation_rate": 0.01,
+}
+
+
+def dominates(a, b) -> bool:
+    return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+class TestNonDominatedSort(unittest.TestCase):
+    def test_matches_brute_force_dominance(self):
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        objectives = rng.integers(0, 5, size=(40, 3)).astype(float)
+        fronts = fast_non_dominated_sort(objectives)
+        self.assertEqual(
+            sorted(i for front in fronts for i in front), list(range(len(objectives)))
+        )
+        rank = {i: f for f, front in enumerate(fronts) for i in front}
+        for i, a in enumerate(objectives):
+            for j, b in enumerate(objectives):
+                if dominates(a, b):
+                    self.assertLess(rank[i], rank[j])
+            # Every member past the first front is dominated by one of the previous front
+            if rank[i] > 0:
+                self.assertTrue(
+                    any(dominates(objectives[k], a) for k in fronts[rank[i] - 1])
+                )
+
+    def test_crowding_distance(self):
+        import numpy as np
+
+        objectives = np.array([[0.0, 4.0], [1.0, 2.0], [3.0, 1.0], [4.0, 0.0]])
+        distance = crowding_distance(objectives)
+        self.assertTrue(np.isinf(distance[0]) and np.isinf(distance[3]))
+        self.assertAlmostEqual(distance[1], 3 / 4 + 3 / 4)
+        self.assertAlmostEqual(distance[2], 3 / 4 + 2 / 4)
+        self.assertTrue(np.isinf(crowding_distance(objectives[:2])).all())
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+class TestEvolvePareto(unittest.TestCase):
+    def test_front_is_non_dominated_with_unweighted_values(self):
+        random.seed(0)
+        generator = ParetoTimetableGenerator(
+            CONFIG, SUBJECTS, DAYS, TIME_SLOTS, PREFERENCES
+        )
+        front = generator.evolve_pareto()
+        self.assertTrue(front)
+        terms = generator.fitness_evaluator.terms
+        rewards = set(
+            list(terms)[len(generator.fitness_evaluator.penalties.penalty_objects) :]
+        )
+        vectors = []
+        for individual, values in front:
+            self.assertEqual(list(values), generator.objective_names)
+            for name, term in terms.items():
+                self.assertEqual(
+                    values[name],
+                    term.calculate(individual, PREFERENCES, SUBJECTS, TIME_SLOTS),
+                )
+            vectors.append(
+                [-values[name] if name in rewards else values[name] for name in terms]
+            )
+        for a in vectors:
+            self.assertFalse(any(dominates(b, a) for b in vectors))
+        keys = [individual.genome_key() for individual, _ in front]
+        self.assertEqual(len(set(keys)), len(keys))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import importlib.util
+import os
+import random
+import tempfile
+import unittest
+
+from lib.src.algorithms.generative_algorithm import TimetableGenerator
+from lib.src.algorithms.population import PopulationInitializer
+from lib.src.models.encoding import GenomeEncoder
+from lib.src.models.population_store import MemmapPopulationStore
+
+SUBJECTS = ["Math", "Science", "English"]
+DAYS = ["Monday", "Tuesday", "Wednesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00"]
+PREFERENCES = {"Math": {"Monday": "09:00"}}
+CONFIG = {
+    "population_size": 20,
+    "num_generations": 6,
+    "elite_percentage": 0.2,
+    "initial_mutation_rate": 0.3,
+    "final_mutation_rate": 0.01,
+    "tournament_size": 3,
+    "diversity_weight": 2,
+}
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+class TestMemmapPopulationStore(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "population.mm")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_swap_and_reopen(self):
+        encoder = GenomeEncoder(SUBJECTS, DAYS, TIME_SLOTS)
+        initializer = PopulationInitializer(SUBJECTS, DAYS, TIME_SLOTS, PREFERENCES)
+        individuals = [initializer.generate_individual() for _ in range(4)]
+        store = MemmapPopulationStore.create(self.path, encoder, 4, {"note": 1})
+        for index, individual in enumerate(individuals):
+            store.write(index, individual, float(index))
+        store.swap()
+        store.copy_to_next(3, 0)
+        store.flush()
+
+        reopened = MemmapPopulationStore.open(self.path)
+        self.assertEqual(reopened.generation, 1)
+        self.assertEqual(reopened.metadata, {"note": 1})
+        self.assertEqual(list(reopened.fitness), [0.0, 1.0, 2.0, 3.0])
+        for index, individual in enumerate(individuals):
+            decoded = reopened.get(index)
+            self.assertEqual(decoded.timetable, individual.timetable)
+            self.assertEqual(decoded.occupancy, individual.occupancy)
+        reopened.swap()
+        self.assertEqual(reopened.get(0).timetable, individuals[3].timetable)
+
+    def make_generator(self, preferences=PREFERENCES, subjects=SUBJECTS):
+        return TimetableGenerator(dict(CONFIG), subjects, DAYS, TIME_SLOTS, preferences)
+
+    def test_resume_continues_from_the_stored_generation(self):
+        generator = self.make_generator()
+        generator.evolve_on_disk(self.path, max_generations=3, chunk_size=7)
+        self.assertEqual(MemmapPopulationStore.open(self.path).generation, 3)
+        best = generator.evolve_on_disk(self.path, chunk_size=7)
+        store = MemmapPopulationStore.open(self.path)
+        self.assertEqual(store.generation, CONFIG["num_generations"])
+        self.assertEqual(
+            generator.fitness_evaluator.calculate_fitness(best), max(store.fitness)
+        )
+
+    def test_resume_rejects_another_problem(self):
+        self.make_generator().evolve_on_disk(self.path, max_generations=1)
+        with self.assertRaises(ValueError):
+            self.make_generator(preferences={}).evolve_on_disk(self.path)
+        with self.assertRaises(ValueError):
+            self.make_generator(subjects=["Art", "Music"]).evolve_on_disk(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
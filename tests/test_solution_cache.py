@@ -0,0 +1,125 @@
+import os
+import random
+import tempfile
+import unittest
+
+from lib.src.algorithms.generative_algorithm import TimetableGenerator
+from lib.src.algorithms.solution_cache import SolutionCache, problem_fingerprint
+
+SUBJECTS = ["Math", "Science", "English"]
+DAYS = ["Monday", "Tuesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00"]
+PREFERENCES = {"Math": {"Monday": "09:00", "Tuesday": None}}
+CONFIG = {
+    "population_size": 10,
+    "num_generations": 4,
+    "elite_percentage": 0.2,
+    "initial_mutation_rate": 0.3,
+    "final_mutation_rate": 0.01,
+    "diversity_threshold": 0.5,
+}
+
+
+def make_generator(subjects=SUBJECTS, days=DAYS, preferences=PREFERENCES):
+    return TimetableGenerator(dict(CONFIG), subjects, days, TIME_SLOTS, preferences)
+
+
+class TestProblemFingerprint(unittest.TestCase):
+    def test_ignores_order_and_empty_preferences(self):
+        fingerprint = problem_fingerprint(
+            SUBJECTS, DAYS, TIME_SLOTS, PREFERENCES, CONFIG
+        )
+        self.assertEqual(
+            fingerprint,
+            problem_fingerprint(
+                SUBJECTS[::-1],
+                DAYS[::-1],
+                TIME_SLOTS,
+                {"Math": {"Monday": "09:00"}, "Science": {"Monday": None}},
+                dict(reversed(list(CONFIG.items()))),
+            ),
+        )
+
+    def test_depends_on_time_slot_order_and_config(self):
+        fingerprint = problem_fingerprint(
+            SUBJECTS, DAYS, TIME_SLOTS, PREFERENCES, CONFIG
+        )
+        self.assertNotEqual(
+            fingerprint,
+            problem_fingerprint(SUBJECTS, DAYS, TIME_SLOTS[::-1], PREFERENCES, CONFIG),
+        )
+        self.assertNotEqual(
+            fingerprint,
+            problem_fingerprint(
+                SUBJECTS,
+                DAYS,
+                TIME_SLOTS,
+                PREFERENCES,
+                {**CONFIG, "num_generations": 5},
+            ),
+        )
+
+
+class TestSolutionCache(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def make_cache(self, **kwargs) -> SolutionCache:
+        return SolutionCache(self.directory.name, **kwargs)
+
+    def test_hit_for_equal_problem_and_persisted_index(self):
+        cache = self.make_cache()
+        best = cache.solve(make_generator())
+        reordered = make_generator(subjects=SUBJECTS[::-1], days=DAYS[::-1])
+        self.assertEqual(self.make_cache().solve(reordered).timetable, best.timetable)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_max_generations_is_part_of_the_fingerprint(self):
+        cache = self.make_cache()
+        cache.solve(make_generator(), max_generations=2)
+        cache.solve(make_generator())
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        cache.solve(make_generator(), max_generations=2)
+        self.assertEqual(cache.hits, 1)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = self.make_cache()
+        generators = [
+            make_generator(preferences={"Math": {"Monday": time}})
+            for time in TIME_SLOTS
+        ]
+        fingerprints = [cache.fingerprint(generator) for generator in generators]
+        for generator in generators:
+            cache.solve(generator)
+        size = cache.index[fingerprints[0]]["size"]
+        cache.get(fingerprints[0])  # Most recently used now
+        cache.max_bytes = 2 * size + size // 2
+        cache._evict()
+        self.assertEqual(set(cache.index), {fingerprints[0], fingerprints[2]})
+        self.assertFalse(os.path.exists(cache._entry_path(fingerprints[1])))
+
+    def test_nearest_and_seed_population(self):
+        cache = self.make_cache(seed_fraction=0.5)
+        cache.solve(make_generator())
+        other_days = make_generator(days=["Monday", "Friday"])
+        self.assertEqual(cache.nearest(other_days), [])
+
+        similar = make_generator(subjects=["Math", "Science", "Art"])
+        ((similarity, fingerprint),) = cache.nearest(similar)
+        self.assertEqual(fingerprint, cache.fingerprint(make_generator()))
+        self.assertAlmostEqual(similarity, (2 / 4 + 1) / 2)
+
+        seeds = cache.seed_population(similar)
+        self.assertEqual(len(seeds), CONFIG["population_size"] // 2)
+        for seed in seeds:
+            used = {s for day in seed.timetable.values() for s in day.values()}
+            self.assertNotIn("English", used)
+            self.assertTrue(used <= {"Math", "Science", "Art", "Free"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import time
+import unittest
+
+from lib.src.service.solve_service import (
+    CANCELLED,
+    DONE,
+    FINISHED_STATES,
+    RUNNING,
+    TIMED_OUT,
+    QueueFullError,
+    SolveService,
+)
+
+PROBLEM = {
+    "subjects": ["Math", "Science"],
+    "days": ["Monday", "Tuesday"],
+    "time_slots": ["09:00", "10:00"],
+    "preferences": {},
+}
+CONFIG = {"population_size": 10, "num_generations": 5}
+# Enough generations that a job is still running when it is cancelled or times out
+LONG_PROBLEM = {**PROBLEM, "config": {"num_generations": 10**7}}
+
+
+async def wait_for_status(job, states, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while job.status not in states:
+        if time.monotonic() > deadline:
+            raise AssertionError(f"job stayed {job.status}")
+        await asyncio.sleep(0.05)
+
+
+class TestSolveServiceQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_full_queue_rejects_submissions(self):
+        service = SolveService(CONFIG, workers=1, max_queue=2)
+        service.submit(PROBLEM)
+        service.submit(PROBLEM)
+        with self.assertRaises(QueueFullError):
+            service.submit(PROBLEM)
+        self.assertEqual(len(service.jobs), 2)
+
+    async def test_cancelled_and_expired_jobs_never_run(self):
+        service = SolveService(CONFIG, workers=1)
+        cancelled = service.submit(PROBLEM)
+        await service.cancel(cancelled)
+        expired = service.submit(PROBLEM, deadline_seconds=0.01)
+        await asyncio.sleep(0.05)
+        await service.start()
+        try:
+            await wait_for_status(expired, FINISHED_STATES)
+        finally:
+            await service.stop()
+        self.assertEqual(cancelled.status, CANCELLED)
+        self.assertEqual(expired.status, TIMED_OUT)
+        self.assertIsNone(expired.result)
+
+
+class TestSolveServiceJobs(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = SolveService(CONFIG, workers=2, progress_interval=1)
+        await self.service.start()
+
+    async def asyncTearDown(self):
+        await self.service.stop()
+
+    async def test_job_completes_with_default_configuration(self):
+        job = self.service.submit({**PROBLEM, "config": {}})
+        await wait_for_status(job, FINISHED_STATES)
+        self.assertEqual(job.status, DONE)
+        self.assertIn("timetable", job.result)
+        self.assertIsNotNone(job.progress)
+
+    async def test_running_job_is_cancelled(self):
+        job = self.service.submit(LONG_PROBLEM)
+        await wait_for_status(job, (RUNNING,))
+        await self.service.cancel(job)
+        await wait_for_status(job, FINISHED_STATES)
+        self.assertEqual(job.status, CANCELLED)
+        self.assertIn("timetable", job.result)
+
+    async def test_running_job_times_out(self):
+        job = self.service.submit(LONG_PROBLEM, deadline_seconds=1)
+        await wait_for_status(job, FINISHED_STATES)
+        self.assertEqual(job.status, TIMED_OUT)
+        self.assertIn("timetable", job.result)
+
+
+class TestSolveServiceHttp(unittest.IsolatedAsyncioTestCase):
+    async def request(self, method, path, payload=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        body = json.dumps(payload).encode() if payload is not None else b""
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(body)
+
+    async def test_submit_status_backpressure_and_cancel(self):
+        service = SolveService(CONFIG, workers=1, max_queue=1)
+        server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+        self.port = server.sockets[0].getsockname()[1]
+        async with server:
+            status, body = await self.request("POST", "/jobs", PROBLEM)
+            self.assertEqual(status, 202)
+            job_id = body["id"]
+            status, _ = await self.request("POST", "/jobs", PROBLEM)
+            self.assertEqual(status, 503)
+            status, body = await self.request("GET", f"/jobs/{job_id}")
+            self.assertEqual((status, body["status"]), (200, "queued"))
+            status, body = await self.request("DELETE", f"/jobs/{job_id}")
+            self.assertEqual((status, body["status"]), (202, CANCELLED))
+            status, _ = await self.request("POST", "/jobs", {"subjects": []})
+            self.assertEqual(status, 400)
+            status, _ = await self.request("GET", "/jobs/unknown")
+            self.assertEqual(status, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
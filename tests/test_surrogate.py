@@ -0,0 +1,152 @@
+import importlib.util
+import random
+import unittest
+from unittest import mock
+
+from lib.src.algorithms.generative_algorithm import TimetableGenerator
+from lib.src.algorithms.population import PopulationInitializer
+from lib.src.algorithms.surrogate import SurrogateModel
+
+SUBJECTS = ["Math", "Science", "English", "History"]
+DAYS = ["Monday", "Tuesday", "Wednesday"]
+TIME_SLOTS = ["09:00", "10:00", "11:00", "12:00"]
+PREFERENCES = {"Math": {"Monday": "09:00"}}
+CONFIG = {
+    "population_size": 12,
+    "num_generations": 5,
+    "elite_percentage": 0.25,
+    "initial_mutation_rate": 0.3,
+    "final_mutation_rate": 0.01,
+    "tournament_size": 3,
+    "diversity_weight": 2,
+    "diversity_threshold": 0.5,
+    "surrogate_fraction": 0.25,
+}
+
+
+def make_generator(**config) -> TimetableGenerator:
+    return TimetableGenerator(
+        {**CONFIG, **config}, SUBJECTS, DAYS, TIME_SLOTS, PREFERENCES
+    )
+
+
+def random_individuals(count):
+    initializer = PopulationInitializer(SUBJECTS, DAYS, TIME_SLOTS, PREFERENCES)
+    return [initializer.generate_individual() for _ in range(count)]
+
+
+def math_slots(individual):
+    return sum(
+        subject == "Math"
+        for schedule in individual.timetable.values()
+        for subject in schedule.values()
+    )
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+class TestSurrogateModel(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.model = SurrogateModel(SUBJECTS, DAYS, alpha=1e-6)
+
+    def test_learns_a_linear_fitness(self):
+        individuals = random_individuals(100)
+        targets = [500 + 10 * math_slots(ind) for ind in individuals]
+        self.model.observe(individuals[:50], targets[:50])
+        self.assertIsNone(self.model.error)
+        self.model.observe(individuals[50:], targets[50:])
+        self.assertLess(self.model.error, 1e-3)
+        self.assertTrue(self.model.is_reliable)
+
+        unseen = random_individuals(10)
+        for individual, estimate in zip(unseen, self.model.predict(unseen)):
+            self.assertAlmostEqual(estimate, 500 + 10 * math_slots(individual), 3)
+
+    def test_is_not_reliable_on_noise(self):
+        individuals = random_individuals(150)
+        targets = [random.uniform(0, 1000) for _ in individuals]
+        for start in range(0, 150, 50):
+            self.model.observe(
+                individuals[start : start + 50], targets[start : start + 50]
+            )
+        self.assertGreater(self.model.error, self.model.max_error)
+        self.assertFalse(self.model.is_reliable)
+
+    def test_invalid_individuals_are_ignored(self):
+        self.model.observe(random_individuals(3), [float("-inf")] * 3)
+        self.assertEqual(self.model.num_samples, 0)
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+class TestScreenedBreeding(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.generator = make_generator()
+        self.generator.population = random_individuals(CONFIG["population_size"])
+        self.generator._allocate_next_population()
+
+    def make_reliable(self, fitness=900.0):
+        """Train the surrogate to estimate every individual at fitness."""
+        for _ in range(2):
+            individuals = random_individuals(60)
+            self.generator.surrogate.observe(individuals, [fitness] * len(individuals))
+
+    def test_fraction_must_be_in_range(self):
+        with self.assertRaises(ValueError):
+            make_generator(surrogate_fraction=1.5)
+
+    def test_unreliable_surrogate_scores_every_offspring(self):
+        offspring = self.generator._next_population
+        self.generator._breed_screened(offspring, 0, 0.1)
+        evaluator = self.generator.fitness_evaluator
+        self.assertTrue(all(ind.scored_by is evaluator for ind in offspring))
+        self.assertEqual(self.generator.surrogate.num_samples, len(offspring))
+
+    def test_reliable_surrogate_scores_the_best_and_an_audit_sample(self):
+        self.make_reliable()
+        offspring = self.generator._next_population
+        self.generator._breed_screened(offspring, 0, 0.1)
+
+        evaluator = self.generator.fitness_evaluator
+        scored = [ind for ind in offspring if ind.scored_by is evaluator]
+        predicted = [ind for ind in offspring if ind.predicted_fitness is not None]
+        # ceil(0.25 * 12) ranked best, plus one audited of the 9 others
+        self.assertEqual(len(scored), 4)
+        self.assertEqual(len(predicted), 8)
+        self.assertEqual(self.generator.surrogate.num_samples, 120 + 4)
+        for individual in predicted:
+            self.assertAlmostEqual(evaluator.calculate_fitness(individual), 900.0)
+
+    def test_best_individual_is_scored_exactly(self):
+        self.make_reliable(fitness=5000.0)
+        self.generator._breed_screened(self.generator._next_population, 0, 0.1)
+        self.generator.population = self.generator._next_population
+
+        best = self.generator._best_individual()
+        self.assertIsNone(best.predicted_fitness)
+        self.assertEqual(
+            self.generator.fitness_evaluator.calculate_fitness(best),
+            max(
+                make_generator().fitness_evaluator.calculate_fitness(ind.copy())
+                for ind in self.generator.population
+                if ind.predicted_fitness is None
+            ),
+        )
+
+    def test_evolve_returns_an_exact_result(self):
+        best = self.generator.evolve(max_generations=10)
+        self.assertIsNone(best.predicted_fitness)
+
+    def test_reoptimize_rebuilds_the_surrogate(self):
+        self.generator.evolve()
+        state = self.generator.get_state()
+        surrogate = self.generator.surrogate
+        self.assertGreater(surrogate.num_samples, 0)
+        with mock.patch.object(self.generator, "evolve"):
+            self.generator.reoptimize(state, {"Math": {"Tuesday": "10:00"}})
+        self.assertIsNot(self.generator.surrogate, surrogate)
+        self.assertEqual(self.generator.surrogate.num_samples, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()